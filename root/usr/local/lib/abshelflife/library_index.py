@@ -0,0 +1,379 @@
+"""Library identity index stage for abshelflife-sync.
+
+Walks every library of one ABS target page by page and upserts item_identity
+with one multi-row statement per page. Canonical keys follow
+canonical_key_from_fields in abshelflife-sync (including ABS_MATCH_PRIORITY),
+so rows written here and rows written by the per-item fallback agree.
+
+Connection details come from the environment (ABS_DB_*, ABS_INDEX_*); the
+token is passed via ABS_INDEX_TOKEN so it never shows up in the process list.
+Rows whose identity_hash already matches the remote fields are left alone, so
+an unchanged library does not rewrite (and re-stamp) item_identity.
+
+Each library keeps its own schedule in library_index_state: quiet libraries
+are refreshed less often, busy ones more often, and every next refresh is
+jittered so targets and libraries drift apart instead of firing together.
+A next_refresh_ms of 0 (set by abshelflife-sync when a pull sees an unknown
+item) makes a library due immediately. Prints "processed new updated
+unchanged" (tab separated) on stdout.
+"""
+
+import hashlib
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Iterator
+
+import pymysql
+import requests
+
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+TITLE_STRIP_RE = re.compile(r"[^a-z0-9]+")
+AUTHOR_STRIP_RE = re.compile(r"[^a-z0-9,]+")
+IDENTIFIER_STRIP_RE = re.compile(r"[^A-Z0-9]+")
+
+# Share of changed (new or updated) items above which a library's interval is
+# halved; a refresh without any change stretches it by half.
+BUSY_CHANGE_RATIO = 0.01
+
+# Bare %s placeholders only: PyMySQL rewrites executemany() into one multi-row
+# INSERT just for statements whose VALUES tuple matches its RE_INSERT_VALUES,
+# so empty strings are turned into NULL in rows() instead of with NULLIF().
+UPSERT_SQL = """
+INSERT INTO item_identity (
+  target_id, library_item_id, canonical_key, asin, isbn, title, author, series_name, published_year, duration_sec,
+  identity_hash
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+  canonical_key = VALUES(canonical_key),
+  asin = VALUES(asin),
+  isbn = VALUES(isbn),
+  title = VALUES(title),
+  author = VALUES(author),
+  series_name = VALUES(series_name),
+  published_year = VALUES(published_year),
+  duration_sec = VALUES(duration_sec),
+  identity_hash = VALUES(identity_hash)
+"""
+
+
+def log(message: str) -> None:
+    print(f"[abshelflife] {message}", file=sys.stderr)
+
+
+def warn(message: str) -> None:
+    print(f"[abshelflife][warn] {message}", file=sys.stderr)
+
+
+def match_priorities() -> list[str]:
+    raw = os.getenv("ABS_MATCH_PRIORITY", "asin,isbn,title_author_duration")
+    return [p.strip().translate(ASCII_LOWER) for p in raw.split(",") if p.strip()]
+
+
+def _squash(value: str, pattern: re.Pattern[str]) -> str:
+    return pattern.sub(" ", (value or "").translate(ASCII_LOWER)).strip()
+
+
+def _identifier(value: str) -> str:
+    return IDENTIFIER_STRIP_RE.sub("", (value or "").upper())
+
+
+def _rounded_duration(value: Any) -> str:
+    try:
+        return "%.0f" % float(value or 0)
+    except (TypeError, ValueError):
+        return "0"
+
+
+def canonical_key(priorities: list[str], asin: str, isbn: str, title: str, author: str, duration: Any) -> str:
+    asin_norm = _identifier(asin)
+    isbn_norm = _identifier(isbn)
+    for priority in priorities:
+        if priority == "asin" and asin_norm and asin_norm != "NULL":
+            return f"asin:{asin_norm}"
+        if priority == "isbn" and isbn_norm and isbn_norm != "NULL":
+            return f"isbn:{isbn_norm}"
+        if priority == "title_author_duration":
+            normalized_title = _squash(title, TITLE_STRIP_RE)
+            if normalized_title:
+                base = f"{normalized_title}|{_squash(author, AUTHOR_STRIP_RE)}|{_rounded_duration(duration)}"
+                return f"tad:{hashlib.sha1(base.encode('utf-8')).hexdigest()}"
+    return ""
+
+
+def identity_hash(values: tuple[Any, ...]) -> str:
+    # Fingerprint of every item_identity column written besides the primary key.
+    text = "\x1f".join("" if value is None else repr(value) if isinstance(value, float) else str(value) for value in values)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _first(*values: Any) -> Any:
+    # jq's `//`: the first value that is neither null nor false.
+    for value in values:
+        if value is not None and value is not False:
+            return value
+    return None
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _null_if_empty(value: str) -> str | None:
+    return value or None
+
+
+def _number(value: Any, cast: type) -> Any:
+    try:
+        return cast(float(value or 0))
+    except (TypeError, ValueError):
+        return cast(0)
+
+
+def identity_fields(item: dict[str, Any]) -> dict[str, Any]:
+    media = item.get("media") or {}
+    metadata = media.get("metadata") or {}
+    identifiers = metadata.get("identifiers") or {}
+    series = metadata.get("series") or []
+    first_series = series[0] if isinstance(series, list) and series and isinstance(series[0], dict) else {}
+    authors = metadata.get("authors") or []
+    return {
+        "id": _text(item.get("id")),
+        "asin": _text(_first(metadata.get("asin"), identifiers.get("asin"), metadata.get("amazonAsin"))),
+        "isbn": _text(_first(metadata.get("isbn"), identifiers.get("isbn"))),
+        "title": _text(metadata.get("title")),
+        "author": ", ".join(_text(a.get("name")) for a in authors if isinstance(a, dict)),
+        "series_name": _text(_first(metadata.get("seriesName"), first_series.get("name"))),
+        "published_year": _number(_first(metadata.get("publishedYear"), metadata.get("publishYear")), int),
+        "duration": _number(media.get("duration"), float),
+    }
+
+
+class LibraryIndexer:
+    def __init__(
+        self,
+        target_id: str,
+        base_url: str,
+        token: str,
+        page_size: int,
+        interval: int,
+        min_interval: int,
+        max_interval: int,
+    ) -> None:
+        self.target_id = target_id
+        self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self.interval = interval
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max(min_interval, max_interval)
+        self.priorities = match_priorities()
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        resp = self.session.get(f"{self.base_url}{path}", params=params, timeout=60)
+        resp.raise_for_status()
+        return resp.json()
+
+    def library_ids(self) -> list[str]:
+        payload = self._get("/api/libraries")
+        libraries = payload.get("libraries") if isinstance(payload, dict) else payload
+        return [str(lib["id"]) for lib in libraries or [] if isinstance(lib, dict) and lib.get("id")]
+
+    def pages(self, library_id: str) -> Iterator[list[dict[str, Any]]]:
+        page = 0
+        while True:
+            payload = self._get(
+                f"/api/libraries/{library_id}/items",
+                {"limit": self.page_size, "page": page, "minified": 0},
+            )
+            results = payload.get("results") if isinstance(payload, dict) else None
+            if not results:
+                return
+            yield results
+            page += 1
+
+    def rows(self, items: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+        rows = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            fields = identity_fields(item)
+            if not fields["id"]:
+                continue
+            ck = canonical_key(
+                self.priorities, fields["asin"], fields["isbn"], fields["title"], fields["author"], fields["duration"]
+            )
+            values = (
+                ck,
+                fields["asin"],
+                fields["isbn"],
+                fields["title"],
+                fields["author"],
+                fields["series_name"],
+                fields["published_year"],
+                fields["duration"],
+            )
+            # The hash covers the raw values; the text columns are stored as NULL when empty.
+            columns = (*(_null_if_empty(value) for value in values[:6]), *values[6:])
+            rows.append((self.target_id, fields["id"], *columns, identity_hash(values)))
+        return rows
+
+    def stored_hashes(self, cur: Any, item_ids: list[str]) -> dict[str, str | None]:
+        placeholders = ",".join(["%s"] * len(item_ids))
+        cur.execute(
+            f"""
+            SELECT library_item_id, identity_hash
+            FROM item_identity
+            WHERE target_id = %s
+              AND library_item_id IN ({placeholders})
+            """,
+            (self.target_id, *item_ids),
+        )
+        return {row[0]: row[1] for row in cur.fetchall()}
+
+    def schedules(self, cur: Any) -> dict[str, tuple[int, int]]:
+        cur.execute(
+            "SELECT library_id, interval_seconds, next_refresh_ms FROM library_index_state WHERE target_id = %s",
+            (self.target_id,),
+        )
+        return {row[0]: (int(row[1]), int(row[2])) for row in cur.fetchall()}
+
+    def next_interval(self, current: int | None, changed: int, processed: int) -> int:
+        if current is None:
+            return self.interval
+        if changed == 0:
+            current = int(current * 1.5)
+        elif changed / max(processed, 1) > BUSY_CHANGE_RATIO:
+            current = current // 2
+        return max(self.min_interval, min(self.max_interval, current))
+
+    def save_schedule(self, cur: Any, library_id: str, interval: int, first: bool, counts: dict[str, int]) -> None:
+        now_ms = int(time.time() * 1000)
+        # First schedules spread over the whole interval, later ones by +-10%.
+        jitter = random.uniform(0.5, 1.5) if first else random.uniform(0.9, 1.1)
+        cur.execute(
+            """
+            INSERT INTO library_index_state (
+              target_id, library_id, interval_seconds, next_refresh_ms, last_refresh_ms,
+              last_processed, last_changed
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              interval_seconds = VALUES(interval_seconds),
+              next_refresh_ms = VALUES(next_refresh_ms),
+              last_refresh_ms = VALUES(last_refresh_ms),
+              last_processed = VALUES(last_processed),
+              last_changed = VALUES(last_changed)
+            """,
+            (
+                self.target_id,
+                library_id,
+                interval,
+                now_ms + int(interval * jitter * 1000),
+                now_ms,
+                counts["processed"],
+                counts["new"] + counts["updated"],
+            ),
+        )
+
+    def index_library(self, cur: Any, conn: Any, library_id: str) -> dict[str, int]:
+        counts = {"processed": 0, "new": 0, "updated": 0, "unchanged": 0}
+        for items in self.pages(library_id):
+            rows = self.rows(items)
+            if not rows:
+                continue
+            stored = self.stored_hashes(cur, [row[1] for row in rows])
+            changed = []
+            for row in rows:
+                if row[1] not in stored:
+                    counts["new"] += 1
+                elif stored[row[1]] != row[-1]:
+                    counts["updated"] += 1
+                else:
+                    counts["unchanged"] += 1
+                    continue
+                changed.append(row)
+            if changed:
+                cur.executemany(UPSERT_SQL, changed)
+            conn.commit()
+            counts["processed"] += len(rows)
+        return counts
+
+    def run(self, conn: Any) -> dict[str, int]:
+        counts = {"processed": 0, "new": 0, "updated": 0, "unchanged": 0}
+        started = time.monotonic()
+        with conn.cursor() as cur:
+            schedules = self.schedules(cur)
+            library_ids = self.library_ids()
+            gone = [library_id for library_id in schedules if library_id not in library_ids]
+            if gone:
+                placeholders = ",".join(["%s"] * len(gone))
+                cur.execute(
+                    f"DELETE FROM library_index_state WHERE target_id = %s AND library_id IN ({placeholders})",
+                    (self.target_id, *gone),
+                )
+                conn.commit()
+            for library_id in library_ids:
+                interval, next_refresh_ms = schedules.get(library_id, (None, 0))
+                if next_refresh_ms > int(time.time() * 1000):
+                    continue
+                try:
+                    library_counts = self.index_library(cur, conn, library_id)
+                except (requests.RequestException, ValueError) as exc:
+                    # Leave the schedule alone so the library is retried next cycle.
+                    conn.rollback()
+                    warn(f"target={self.target_id} library index request failed library={library_id} ({exc})")
+                    continue
+                new_interval = self.next_interval(
+                    interval, library_counts["new"] + library_counts["updated"], library_counts["processed"]
+                )
+                self.save_schedule(cur, library_id, new_interval, interval is None, library_counts)
+                conn.commit()
+                for key, value in library_counts.items():
+                    counts[key] += value
+        elapsed = max(time.monotonic() - started, 0.001)
+        log(f"target={self.target_id} library index processed {counts['processed']} items ({counts['processed'] / elapsed:.0f}/s)")
+        return counts
+
+
+def main() -> int:
+    target_id = os.getenv("ABS_INDEX_TARGET_ID", "")
+    base_url = os.getenv("ABS_INDEX_BASE_URL", "")
+    token = os.getenv("ABS_INDEX_TOKEN", "")
+    if not target_id or not base_url or not token:
+        warn("library index needs ABS_INDEX_TARGET_ID, ABS_INDEX_BASE_URL and ABS_INDEX_TOKEN")
+        return 2
+
+    indexer = LibraryIndexer(
+        target_id,
+        base_url,
+        token,
+        int(os.getenv("ABS_LIBRARY_INDEX_PAGE_SIZE", "200")),
+        int(os.getenv("ABS_LIBRARY_INDEX_INTERVAL_SECONDS", "21600")),
+        int(os.getenv("ABS_LIBRARY_INDEX_MIN_INTERVAL_SECONDS", "1800")),
+        int(os.getenv("ABS_LIBRARY_INDEX_MAX_INTERVAL_SECONDS", "86400")),
+    )
+    conn = pymysql.connect(
+        host=os.getenv("ABS_DB_HOST", "127.0.0.1"),
+        port=int(os.getenv("ABS_DB_PORT", "3306")),
+        user=os.getenv("ABS_DB_USER", "abshelflife"),
+        password=os.getenv("ABS_DB_PASSWORD", ""),
+        database=os.getenv("ABS_DB_NAME", "abshelflife"),
+        charset="utf8mb4",
+        autocommit=False,
+    )
+    try:
+        counts = indexer.run(conn)
+        print(f"{counts['processed']}\t{counts['new']}\t{counts['updated']}\t{counts['unchanged']}")
+    except (requests.RequestException, ValueError) as exc:
+        warn(f"target={target_id} library index failed GET /api/libraries ({exc})")
+        return 1
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+# shellcheck shell=bash
+# Sourced by abshelflife-sync and abshelflife-queue-update; the UI mirrors it
+# as OUTBOX_COALESCE_SQL in app.py.
+#
+# An open outbox row (pending/failed) owns the unique pending_slot of its item.
+# Enqueueing into an occupied slot keeps whichever update is newer and re-arms
+# the row; last_update_ms must stay the last assignment so the IF() checks
+# above it still compare against the stored value.
+# shellcheck disable=SC2034
+OUTBOX_COALESCE_SQL="ON DUPLICATE KEY UPDATE
+  server_id = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(server_id), server_id),
+  principal_id = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(principal_id), principal_id),
+  canonical_key = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), COALESCE(VALUES(canonical_key), canonical_key), canonical_key),
+  progress = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(progress), progress),
+  current_time_sec = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(current_time_sec), current_time_sec),
+  duration = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(duration), duration),
+  is_finished = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(is_finished), is_finished),
+  attempts = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 0, attempts),
+  last_error = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), NULL, last_error),
+  status = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 'pending', status),
+  next_attempt_at = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 0, next_attempt_at),
+  last_update_ms = GREATEST(COALESCE(last_update_ms, 0), VALUES(last_update_ms))"
@@ -0,0 +1,79 @@
+import importlib.util
+import unittest
+from pathlib import Path
+
+import pymysql.converters
+import pymysql.cursors
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "root/usr/local/lib/abshelflife/library_index.py"
+spec = importlib.util.spec_from_file_location("library_index", MODULE_PATH)
+library_index = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(library_index)
+
+
+class FakeConnection:
+    encoding = "utf8"
+
+    def literal(self, value):
+        return pymysql.converters.escape_item(value, self.encoding)
+
+    def commit(self):
+        pass
+
+
+class RecordingCursor(pymysql.cursors.Cursor):
+    """Real PyMySQL executemany(); execute() records the SQL instead of sending it."""
+
+    def __init__(self, connection):
+        super().__init__(connection)
+        self.statements = []
+
+    def execute(self, query, args=None):
+        query = self.mogrify(query, args)
+        self.statements.append(query.decode(self.connection.encoding) if isinstance(query, (bytes, bytearray)) else query)
+        return 1
+
+    def fetchall(self):
+        return []
+
+
+def item(index, asin=""):
+    return {
+        "id": f"li_{index}",
+        "media": {
+            "duration": 3600.0,
+            "metadata": {"title": f"Book {index}", "authors": [{"name": "Author"}], "asin": asin},
+        },
+    }
+
+
+class LibraryIndexUpsertTest(unittest.TestCase):
+    def setUp(self):
+        self.indexer = library_index.LibraryIndexer("t1", "http://abs", "token", 3, 3600, 60, 7200)
+        pages = [[item(1, "B000000001"), item(2), item(3)], [item(4), item(5)]]
+        self.indexer.pages = lambda library_id: iter(pages)
+        self.connection = FakeConnection()
+        self.cursor = RecordingCursor(self.connection)
+
+    def test_upsert_matches_pymysql_multi_row_rewrite(self):
+        self.assertIsNotNone(pymysql.cursors.RE_INSERT_VALUES.match(library_index.UPSERT_SQL))
+
+    def test_one_upsert_per_page(self):
+        counts = self.indexer.index_library(self.cursor, self.connection, "lib1")
+
+        upserts = [sql for sql in self.cursor.statements if sql.lstrip().startswith("INSERT INTO item_identity")]
+        self.assertEqual(len(upserts), 2)
+        self.assertEqual(counts["new"], 5)
+        self.assertIn("'li_3'", upserts[0])
+        self.assertIn("'li_5'", upserts[1])
+
+    def test_empty_text_is_stored_as_null(self):
+        self.indexer.index_library(self.cursor, self.connection, "lib1")
+
+        first_page = next(sql for sql in self.cursor.statements if "INSERT INTO item_identity" in sql)
+        self.assertIn("'asin:B000000001', 'B000000001', NULL, 'Book 1'", first_page)
+        self.assertNotIn("''", first_page)
+
+
+if __name__ == "__main__":
+    unittest.main()
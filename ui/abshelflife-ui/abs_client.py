@@ -0,0 +1,112 @@
+"""Asynchronous ABS API client for high fan-out reads.
+
+AbsAsyncClient exposes the calls of abs_get_json/abs_get_optional_json in
+app.py as coroutines. At most `concurrency` requests per target are in flight
+over one keep-alive connection pool, so thousands of per-item lookups finish
+in a few round-trip times instead of one after another. Idempotent GETs are
+retried on connection errors and 429/502/503/504, like the UI's shared HTTP
+session.
+
+The module does not depend on Flask, so background jobs and the sync engine's
+Python helpers can use it as well. fetch_optional_json_many() is the blocking
+entry point for synchronous callers.
+"""
+
+import asyncio
+from typing import Any
+
+import aiohttp
+
+# Same "not there / not allowed" statuses abs_get_optional_json maps to None.
+OPTIONAL_STATUSES = (400, 401, 403, 404)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def _query(params: dict[str, Any] | None) -> dict[str, str] | None:
+    if params is None:
+        return None
+    return {key: str(int(value)) if isinstance(value, bool) else str(value) for key, value in params.items()}
+
+
+class AbsAsyncClient:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        concurrency: int = 16,
+        timeout: float = 20.0,
+        retries: int = 2,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self._session: aiohttp.ClientSession | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> "AbsAsyncClient":
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {self.token}"},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit_per_host=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        if self._session is None or self._slots is None:
+            raise RuntimeError("AbsAsyncClient must be used as an async context manager")
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            try:
+                async with self._slots, self._session.get(url, params=_query(params)) as resp:
+                    if resp.status in RETRY_STATUSES and attempt < self.retries:
+                        continue
+                    resp.raise_for_status()
+                    return await resp.json(content_type=None)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.retries:
+                    raise
+        raise RuntimeError(f"GET {path} exhausted its retries")
+
+    async def get_optional_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        try:
+            return await self.get_json(path, params)
+        except aiohttp.ClientResponseError as exc:
+            if exc.status in OPTIONAL_STATUSES:
+                return None
+            raise
+        except Exception:
+            return None
+
+    async def get_optional_json_many(
+        self,
+        calls: list[tuple[str, dict[str, Any] | None]],
+    ) -> list[dict[str, Any] | None]:
+        """Results in the order of `calls`; a non-optional HTTP error propagates."""
+        return list(await asyncio.gather(*(self.get_optional_json(path, params) for path, params in calls)))
+
+
+def fetch_optional_json_many(
+    base_url: str,
+    token: str,
+    calls: list[tuple[str, dict[str, Any] | None]],
+    concurrency: int = 16,
+) -> list[dict[str, Any] | None]:
+    """Blocking wrapper around AbsAsyncClient.get_optional_json_many."""
+    if not calls:
+        return []
+
+    async def _run() -> list[dict[str, Any] | None]:
+        async with AbsAsyncClient(base_url, token, concurrency=concurrency) as client:
+            return await client.get_optional_json_many(calls)
+
+    return asyncio.run(_run())
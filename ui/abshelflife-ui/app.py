@@ -1,27 +1,138 @@
 import base64
+import bisect
 import hashlib
 import json
 import os
 import re
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any
+from typing import Any, Callable, Iterator
 from urllib.parse import quote, urlparse
 
 import pymysql
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.fernet import Fernet, InvalidToken
-from flask import Flask, Response, flash, g, redirect, render_template, request, session, url_for
+from flask import Flask, Response, flash, g, jsonify, redirect, render_template, request, session, url_for
 from werkzeug.security import check_password_hash, generate_password_hash
 
+from abs_client import fetch_optional_json_many
+
 app = Flask(__name__)
 app.secret_key = os.getenv("UI_SECRET_KEY", "change-me-in-production")
 
 SCHEMA_READY = False
 
+# Outbound HTTP (ABS, iTunes, feeds, OpenLibrary, Audible) shares one pooled
+# keep-alive session. Idempotent requests are retried on connection errors and
+# 429/502/503/504; ABS_HTTP_HOST_TIMEOUTS overrides timeouts per host
+# ("host=seconds,...").
+HTTP_POOL_HOSTS = max(1, int(os.getenv("ABS_HTTP_POOL_HOSTS", "16") or 16))
+HTTP_POOL_SIZE = max(1, int(os.getenv("ABS_HTTP_POOL_SIZE", "8") or 8))
+HTTP_RETRIES = max(0, int(os.getenv("ABS_HTTP_RETRIES", "2") or 2))
+HTTP_HOST_TIMEOUTS = {
+    host.lower(): float(seconds)
+    for host, seconds in re.findall(r"([^,=\s]+)\s*=\s*(\d+(?:\.\d+)?)", os.getenv("ABS_HTTP_HOST_TIMEOUTS", ""))
+}
+HTTP_METRICS: dict[str, dict[str, float]] = {}
+HTTP_METRICS_LOCK = threading.Lock()
+
+# Parallel ABS requests per target for fan-out reads (per-item progress,
+# library pages) issued through abs_client.
+ABS_ASYNC_CONCURRENCY = max(1, int(os.getenv("ABS_ASYNC_CONCURRENCY", "16") or 16))
+
+# Dashboard progress summaries keyed by target set; reused while the newest
+# progress_latest.change_seq of those targets is unchanged. Bounded LRU, shared
+# by the request threads.
+PROGRESS_SUMMARY_CACHE_SIZE = 256
+PROGRESS_SUMMARY_CACHE: OrderedDict[tuple[str, ...], tuple[int, dict[str, int]]] = OrderedDict()
+PROGRESS_SUMMARY_CACHE_LOCK = threading.Lock()
+
+# OpenLibrary/Audible search results: in-process LRU in front of the optional
+# ui_metadata_cache table. Identical queries in flight share one upstream call.
+METADATA_CACHE_SIZE = max(0, int(os.getenv("ABS_METADATA_CACHE_SIZE", "256") or 256))
+METADATA_CACHE_TTL_SECONDS = max(0, int(os.getenv("ABS_METADATA_CACHE_TTL_SECONDS", "3600") or 3600))
+METADATA_CACHE_DB = os.getenv("ABS_METADATA_CACHE_DB", "1").strip().lower() in ("1", "true", "yes", "on")
+METADATA_CACHE: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+METADATA_INFLIGHT: dict[str, dict[str, Any]] = {}
+METADATA_CACHE_STATS = {"lru_hits": 0, "db_hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+METADATA_CACHE_LOCK = threading.Lock()
+
+# Books written with metadata_source='pending' are enriched via Audible by a
+# background thread, a batch of rows per pass.
+ENRICH_BATCH_SIZE = max(1, int(os.getenv("ABS_ENRICH_BATCH_SIZE", "10") or 10))
+ENRICH_POLL_SECONDS = max(1, int(os.getenv("ABS_ENRICH_POLL_SECONDS", "30") or 30))
+ENRICH_WAKE = threading.Event()
+ENRICH_WORKER: dict[str, threading.Thread] = {}
+ENRICH_WORKER_LOCK = threading.Lock()
+
+# Podcast feeds younger than this are served from ui_podcast_feed_cache without
+# even a conditional request; older ones are revalidated via ETag/Last-Modified.
+PODCAST_FEED_CACHE_TTL_SECONDS = max(0, int(os.getenv("ABS_PODCAST_FEED_CACHE_TTL_SECONDS", "900") or 900))
+# Newest episodes kept per feed on import; 0 keeps the whole feed.
+PODCAST_FEED_MAX_EPISODES = max(0, int(os.getenv("ABS_PODCAST_FEED_MAX_EPISODES", "0") or 0))
+# Guards the per-import-run feed map shared by the enrichment workers.
+FEED_RUN_CACHE_LOCK = threading.Lock()
+
+# Podcast import fans out over shows: enrichment workers in total, and at most
+# PODCAST_IMPORT_PER_HOST simultaneous requests to any single remote host.
+PODCAST_IMPORT_WORKERS = max(1, int(os.getenv("ABS_PODCAST_IMPORT_WORKERS", "8") or 8))
+PODCAST_IMPORT_PER_HOST = max(1, int(os.getenv("ABS_PODCAST_IMPORT_PER_HOST", "4") or 4))
+HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+HOST_SLOTS_LOCK = threading.Lock()
+
+# iTunes lookups are cached in ui_itunes_lookup_cache (hits and misses expire
+# separately) and all outbound iTunes calls share one token bucket.
+ITUNES_CACHE_TTL_SECONDS = max(0, int(os.getenv("ABS_ITUNES_CACHE_TTL_SECONDS", "604800") or 604800))
+ITUNES_NEGATIVE_TTL_SECONDS = max(0, int(os.getenv("ABS_ITUNES_NEGATIVE_TTL_SECONDS", "86400") or 86400))
+ITUNES_RATE_PER_MINUTE = max(1.0, float(os.getenv("ABS_ITUNES_RATE_PER_MINUTE", "20") or 20))
+ITUNES_BUCKET_CAPACITY = max(1.0, ITUNES_RATE_PER_MINUTE / 4)
+ITUNES_BUCKET = {"tokens": ITUNES_BUCKET_CAPACITY, "updated": time.monotonic()}
+ITUNES_BUCKET_LOCK = threading.Lock()
+ITUNES_LOOKUP_BATCH_SIZE = 100
+
+# Feed episodes are matched to ABS episodes by normalized title, then publish
+# date; these fallbacks are tried in order when both miss.
+PODCAST_MATCH_FALLBACKS = [
+    part.strip().lower()
+    for part in os.getenv("ABS_PODCAST_MATCH_FALLBACKS", "guid,enclosure,duration").split(",")
+    if part.strip().lower() in ("guid", "enclosure", "duration")
+]
+# The duration fallback only accepts a single ABS episode within this window.
+PODCAST_MATCH_DURATION_TOLERANCE_SECONDS = max(
+    0.0, float(os.getenv("ABS_PODCAST_MATCH_DURATION_TOLERANCE_SECONDS", "2") or 2)
+)
+
+# Stale episode rows are pruned by primary key in chunks of this size.
+PODCAST_EPISODE_DELETE_CHUNK = 500
+
+# Mirrors OUTBOX_COALESCE_SQL in /usr/local/lib/abshelflife/outbox-coalesce.sh,
+# which both bash scripts source: one open outbox row per item, newest
+# last_update_ms wins. last_update_ms has to remain the final assignment.
+OUTBOX_COALESCE_SQL = """
+ON DUPLICATE KEY UPDATE
+  server_id = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(server_id), server_id),
+  principal_id = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(principal_id), principal_id),
+  canonical_key = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), COALESCE(VALUES(canonical_key), canonical_key), canonical_key),
+  progress = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(progress), progress),
+  current_time_sec = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(current_time_sec), current_time_sec),
+  duration = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(duration), duration),
+  is_finished = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), VALUES(is_finished), is_finished),
+  attempts = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 0, attempts),
+  last_error = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), NULL, last_error),
+  status = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 'pending', status),
+  next_attempt_at = IF(VALUES(last_update_ms) > COALESCE(last_update_ms, 0), 0, next_attempt_at),
+  last_update_ms = GREATEST(COALESCE(last_update_ms, 0), VALUES(last_update_ms))
+"""
+
 TRANSLATIONS: dict[str, dict[str, str]] = {
     "en": {
         "nav.dashboard": "Home",
@@ -57,6 +168,7 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "section.sync_settings": "Sync Settings",
         "section.sync_accounts": "ABS Accounts",
         "section.matching": "Manual Matching",
+        "section.dead_letter": "Dead-Letter Queue",
         "field.title": "Title",
         "field.author": "Author",
         "field.series": "Series",
@@ -97,6 +209,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "action.open_abs": "Open in ABS",
         "action.open_matching": "Open Matching",
         "action.match_now": "Match Now",
+        "action.open_dead_letter": "Dead Letters",
+        "action.requeue_selected": "Requeue Selected",
+        "action.requeue_all": "Requeue All",
         "sync.subtitle": "Manage ABS servers and users. Settings are written to targets.json.",
         "sync.interval": "Sync interval (seconds)",
         "sync.account_form_add": "Add ABS Account",
@@ -130,6 +245,44 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "matching.reference_item": "Reference Item",
         "matching.unmatched": "Unmatched Audiobooks",
         "matching.abs_links": "Unmatched ABS Links",
+        "deadletter.subtitle": "Progress updates that exhausted their push retries. Requeue them once the target is reachable again.",
+        "deadletter.attempts": "Attempts",
+        "deadletter.last_error": "Last Error",
+        "deadletter.circuits": "Paused Targets",
+        "deadletter.paused_until": "Paused Until",
+        "message.no_dead_letter": "No dead-letter updates.",
+        "action.open_stats": "Listening Stats",
+        "stats.title": "Listening Stats",
+        "stats.subtitle": "Daily rollups of listening time and completions across your ABS targets (UTC days).",
+        "stats.hours_7d": "Hours (7 days)",
+        "stats.hours_30d": "Hours (30 days)",
+        "stats.books_30d": "Books finished (30 days)",
+        "stats.weekly_hours": "Hours per Week",
+        "stats.monthly_books": "Books Finished per Month",
+        "stats.per_target": "Activity per Target (30 days)",
+        "stats.week": "Week of",
+        "stats.month": "Month",
+        "stats.hours": "Hours",
+        "stats.books": "Books",
+        "stats.episodes": "Episodes",
+        "stats.updates": "Updates",
+        "stats.last_active": "Last Active",
+        "message.no_stats": "No listening activity recorded yet.",
+        "history.view_latest": "Latest state",
+        "history.view_all": "Full history",
+        "history.all_targets": "All targets",
+        "history.all_sources": "All sources",
+        "history.source_pull": "Pulled from ABS",
+        "history.source_push": "Changed here",
+        "history.all_states": "All states",
+        "history.finished": "Finished",
+        "history.unfinished": "Not finished",
+        "history.updated": "Updated (UTC)",
+        "history.source": "Source",
+        "history.newest": "Newest",
+        "history.older": "Older",
+        "action.apply": "Apply",
+        "message.no_history": "No entries for this filter.",
         "message.no_unmatched": "No unmatched audiobooks found.",
         "message.no_collected": "No collected audiobooks yet. Use Sync Setup -> Import Collected Audiobooks.",
         "message.no_podcasts": "No podcasts imported yet. Use Sync Setup -> Import Podcasts (ABS + iTunes).",
@@ -173,6 +326,7 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "section.sync_settings": "Synchronisation",
         "section.sync_accounts": "ABS-Konten",
         "section.matching": "Manuelles Matching",
+        "section.dead_letter": "Dead-Letter-Warteschlange",
         "field.title": "Titel",
         "field.author": "Autor",
         "field.series": "Serie",
@@ -213,6 +367,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "action.open_abs": "In ABS öffnen",
         "action.open_matching": "Matching öffnen",
         "action.match_now": "Jetzt matchen",
+        "action.open_dead_letter": "Dead Letters",
+        "action.requeue_selected": "Ausgewählte erneut einreihen",
+        "action.requeue_all": "Alle erneut einreihen",
         "sync.subtitle": "ABS-Server und Nutzer verwalten. Die Einstellungen werden in targets.json geschrieben.",
         "sync.interval": "Sync-Intervall (Sekunden)",
         "sync.account_form_add": "ABS-Konto hinzufügen",
@@ -246,6 +403,44 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "matching.reference_item": "Referenz-Element",
         "matching.unmatched": "Ungematchte Hörbücher",
         "matching.abs_links": "Ungematchte ABS-Links",
+        "deadletter.subtitle": "Fortschritts-Updates, deren Push-Versuche ausgeschöpft sind. Erneut einreihen, sobald das Target wieder erreichbar ist.",
+        "deadletter.attempts": "Versuche",
+        "deadletter.last_error": "Letzter Fehler",
+        "deadletter.circuits": "Pausierte Targets",
+        "deadletter.paused_until": "Pausiert bis",
+        "message.no_dead_letter": "Keine Dead-Letter-Updates.",
+        "action.open_stats": "Hörstatistik",
+        "stats.title": "Hörstatistik",
+        "stats.subtitle": "Tägliche Auswertung von Hörzeit und Abschlüssen über deine ABS-Targets (UTC-Tage).",
+        "stats.hours_7d": "Stunden (7 Tage)",
+        "stats.hours_30d": "Stunden (30 Tage)",
+        "stats.books_30d": "Beendete Bücher (30 Tage)",
+        "stats.weekly_hours": "Stunden pro Woche",
+        "stats.monthly_books": "Beendete Bücher pro Monat",
+        "stats.per_target": "Aktivität pro Target (30 Tage)",
+        "stats.week": "Woche ab",
+        "stats.month": "Monat",
+        "stats.hours": "Stunden",
+        "stats.books": "Bücher",
+        "stats.episodes": "Folgen",
+        "stats.updates": "Updates",
+        "stats.last_active": "Zuletzt aktiv",
+        "message.no_stats": "Noch keine Höraktivität erfasst.",
+        "history.view_latest": "Aktueller Stand",
+        "history.view_all": "Vollständiger Verlauf",
+        "history.all_targets": "Alle Targets",
+        "history.all_sources": "Alle Quellen",
+        "history.source_pull": "Von ABS abgerufen",
+        "history.source_push": "Hier geändert",
+        "history.all_states": "Alle Zustände",
+        "history.finished": "Beendet",
+        "history.unfinished": "Nicht beendet",
+        "history.updated": "Aktualisiert (UTC)",
+        "history.source": "Quelle",
+        "history.newest": "Neueste",
+        "history.older": "Ältere",
+        "action.apply": "Anwenden",
+        "message.no_history": "Keine Einträge für diesen Filter.",
         "message.no_unmatched": "Keine ungematchten Hörbücher gefunden.",
         "message.no_collected": "Noch keine gesammelten Hörbücher. Nutze Sync-Einrichtung -> Gesammelte Hörbücher importieren.",
         "message.no_podcasts": "Noch keine Podcasts importiert. Nutze Sync-Einrichtung -> Podcasts importieren (ABS + iTunes).",
@@ -516,6 +711,7 @@ def ensure_ui_schema() -> None:
                   duration_sec DOUBLE NULL,
                   image_url TEXT NULL,
                   source VARCHAR(32) NOT NULL DEFAULT 'abs',
+                  fingerprint CHAR(40) NULL,
                   updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
                   PRIMARY KEY(id),
                   UNIQUE KEY uq_ui_podcast_episodes (owner_user_id, target_id, library_item_id, episode_id),
@@ -527,12 +723,56 @@ def ensure_ui_schema() -> None:
                 cur.execute("ALTER TABLE ui_podcast_episodes ADD COLUMN abs_episode_id VARCHAR(64) NULL")
             except Exception:
                 pass
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ui_metadata_cache (
+                  cache_key CHAR(40) NOT NULL,
+                  provider VARCHAR(32) NOT NULL,
+                  query VARCHAR(512) NOT NULL,
+                  results_json MEDIUMTEXT NOT NULL,
+                  expires_at_ms BIGINT NOT NULL,
+                  PRIMARY KEY(cache_key),
+                  KEY idx_metadata_cache_expires (expires_at_ms)
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ui_itunes_lookup_cache (
+                  lookup_key VARCHAR(80) NOT NULL,
+                  found TINYINT(1) NOT NULL DEFAULT 0,
+                  result_json TEXT NULL,
+                  expires_at_ms BIGINT NOT NULL,
+                  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                  PRIMARY KEY(lookup_key),
+                  KEY idx_itunes_lookup_expires (expires_at_ms)
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ui_podcast_feed_cache (
+                  url_hash CHAR(40) NOT NULL,
+                  feed_url TEXT NOT NULL,
+                  etag VARCHAR(512) NULL,
+                  last_modified VARCHAR(128) NULL,
+                  episodes_json LONGTEXT NOT NULL,
+                  fetched_at_ms BIGINT NOT NULL,
+                  checked_at_ms BIGINT NOT NULL,
+                  PRIMARY KEY(url_hash)
+                )
+                """
+            )
             try:
                 cur.execute(
                     "ALTER TABLE ui_podcast_episodes ADD COLUMN abs_presence ENUM('present','missing') NOT NULL DEFAULT 'missing'"
                 )
             except Exception:
                 pass
+            try:
+                cur.execute("ALTER TABLE ui_podcast_episodes ADD COLUMN fingerprint CHAR(40) NULL AFTER source")
+            except Exception:
+                pass
 
             # Migrate plain-text tokens once to encrypted storage.
             cur.execute(
@@ -795,8 +1035,56 @@ def get_user_target_urls(owner_user_id: int) -> dict[str, str]:
     return urls
 
 
+def build_http_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    http = requests.Session()
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    return http
+
+
+HTTP_SESSION = build_http_session()
+
+
+def http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request through the shared session and record per-host metrics."""
+    host = (urlparse(url).hostname or "").lower()
+    if host in HTTP_HOST_TIMEOUTS:
+        kwargs["timeout"] = HTTP_HOST_TIMEOUTS[host]
+    started = time.monotonic()
+    failed = True
+    try:
+        resp = HTTP_SESSION.request(method, url, **kwargs)
+        failed = resp.status_code >= 500 or resp.status_code == 429
+        return resp
+    finally:
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with HTTP_METRICS_LOCK:
+            stats = HTTP_METRICS.setdefault(host, {"requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["requests"] += 1
+            stats["errors"] += 1 if failed else 0
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs: Any) -> requests.Response:
+    return http_request("POST", url, **kwargs)
+
+
 def abs_get_json(base_url: str, token: str, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-    resp = requests.get(
+    resp = http_get(
         f"{base_url}{path}",
         headers={"Authorization": f"Bearer {token}"},
         params=params,
@@ -825,7 +1113,7 @@ def abs_post_optional_json(
     payload: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     try:
-        resp = requests.post(
+        resp = http_post(
             f"{base_url}{path}",
             headers={"Authorization": f"Bearer {token}"},
             json=payload or {},
@@ -938,29 +1226,148 @@ def build_canonical_key(asin: str, isbn: str, title: str, author: str, duration:
     return f"tad:{hashlib.sha1(base.encode('utf-8')).hexdigest()}"
 
 
+@contextmanager
+def host_slot(url: str) -> Iterator[None]:
+    host = (urlparse(url).hostname or "").lower()
+    with HOST_SLOTS_LOCK:
+        slot = HOST_SLOTS.setdefault(host, threading.BoundedSemaphore(PODCAST_IMPORT_PER_HOST))
+    with slot:
+        yield
+
+
+def itunes_take_token() -> None:
+    """Block until the shared iTunes token bucket allows another request."""
+    refill_per_sec = ITUNES_RATE_PER_MINUTE / 60.0
+    while True:
+        with ITUNES_BUCKET_LOCK:
+            now = time.monotonic()
+            tokens = ITUNES_BUCKET["tokens"] + (now - ITUNES_BUCKET["updated"]) * refill_per_sec
+            ITUNES_BUCKET["tokens"] = min(ITUNES_BUCKET_CAPACITY, tokens)
+            ITUNES_BUCKET["updated"] = now
+            if ITUNES_BUCKET["tokens"] >= 1.0:
+                ITUNES_BUCKET["tokens"] -= 1.0
+                return
+            wait = (1.0 - ITUNES_BUCKET["tokens"]) / refill_per_sec
+        time.sleep(wait)
+
+
+def itunes_request(path: str, params: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """iTunes API results, or None when the call failed (e.g. throttled)."""
+    itunes_take_token()
+    try:
+        with host_slot("https://itunes.apple.com"):
+            resp = http_get(f"https://itunes.apple.com{path}", params=params, timeout=10)
+        resp.raise_for_status()
+        return list(resp.json().get("results", []))
+    except Exception:
+        return None
+
+
+def itunes_podcast_fields(hit: dict[str, Any]) -> dict[str, str]:
+    return {
+        "itunes_id": str(hit.get("collectionId") or ""),
+        "itunes_page_url": str(hit.get("collectionViewUrl") or ""),
+        "image_url": str(hit.get("artworkUrl600") or hit.get("artworkUrl100") or ""),
+        "feed_url": str(hit.get("feedUrl") or ""),
+    }
+
+
+def itunes_cache_get(keys: list[str]) -> dict[str, dict[str, str]]:
+    """Unexpired cache entries by key; a miss that was cached maps to {}."""
+    if not keys:
+        return {}
+    placeholders = ",".join(["%s"] * len(keys))
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT lookup_key, found, result_json
+                FROM ui_itunes_lookup_cache
+                WHERE lookup_key IN ({placeholders}) AND expires_at_ms > %s
+                """,
+                [*keys, int(time.time() * 1000)],
+            )
+            rows = cur.fetchall()
+    cached: dict[str, dict[str, str]] = {}
+    for row in rows:
+        try:
+            cached[str(row["lookup_key"])] = json.loads(row["result_json"] or "{}") if int(row["found"] or 0) else {}
+        except ValueError:
+            continue
+    return cached
+
+
+def itunes_cache_put(entries: dict[str, dict[str, str]]) -> None:
+    if not entries:
+        return
+    now_ms = int(time.time() * 1000)
+    rows = [
+        (
+            key,
+            1 if result else 0,
+            json.dumps(result, separators=(",", ":")) if result else None,
+            now_ms + (ITUNES_CACHE_TTL_SECONDS if result else ITUNES_NEGATIVE_TTL_SECONDS) * 1000,
+        )
+        for key, result in entries.items()
+    ]
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO ui_itunes_lookup_cache (lookup_key, found, result_json, expires_at_ms)
+                VALUES (%s,%s,%s,%s)
+                ON DUPLICATE KEY UPDATE
+                  found=VALUES(found),
+                  result_json=VALUES(result_json),
+                  expires_at_ms=VALUES(expires_at_ms)
+                """,
+                rows,
+            )
+
+
 def itunes_lookup_podcast(title: str, author: str) -> dict[str, str]:
     query = " ".join([title or "", author or ""]).strip()
     if not query:
         return {}
-    try:
-        resp = requests.get(
-            "https://itunes.apple.com/search",
-            params={"term": query, "media": "podcast", "entity": "podcast", "limit": 1},
-            timeout=10,
-        )
-        resp.raise_for_status()
-        results = resp.json().get("results", [])
-        if not results:
-            return {}
-        hit = results[0]
-        return {
-            "itunes_id": str(hit.get("collectionId") or ""),
-            "itunes_page_url": str(hit.get("collectionViewUrl") or ""),
-            "image_url": str(hit.get("artworkUrl600") or hit.get("artworkUrl100") or ""),
-            "feed_url": str(hit.get("feedUrl") or ""),
-        }
-    except Exception:
+    key_base = f"{normalize_text_key(title)}|{normalize_text_key(author)}"
+    key = f"q:{hashlib.sha1(key_base.encode('utf-8')).hexdigest()}"
+    cached = itunes_cache_get([key])
+    if key in cached:
+        return cached[key]
+
+    results = itunes_request("/search", {"term": query, "media": "podcast", "entity": "podcast", "limit": 1})
+    if results is None:
+        # Failed or throttled: do not remember this as a miss.
+        return {}
+    result = itunes_podcast_fields(results[0]) if results else {}
+    entries = {key: result}
+    if result.get("itunes_id"):
+        entries[f"id:{result['itunes_id']}"] = result
+    itunes_cache_put(entries)
+    return result
+
+
+def itunes_lookup_ids(itunes_ids: list[str]) -> dict[str, dict[str, str]]:
+    """Podcast details for known iTunes ids, up to 100 ids per /lookup call."""
+    ids = sorted({str(i).strip() for i in itunes_ids if str(i).strip().isdigit()})
+    if not ids:
         return {}
+    cached = itunes_cache_get([f"id:{i}" for i in ids])
+    found = {i: cached[f"id:{i}"] for i in ids if f"id:{i}" in cached}
+    missing = [i for i in ids if f"id:{i}" not in cached]
+    for offset in range(0, len(missing), ITUNES_LOOKUP_BATCH_SIZE):
+        chunk = missing[offset:offset + ITUNES_LOOKUP_BATCH_SIZE]
+        results = itunes_request("/lookup", {"id": ",".join(chunk), "entity": "podcast"})
+        if results is None:
+            continue
+        fetched = {i: {} for i in chunk}
+        for hit in results:
+            hit_id = str(hit.get("collectionId") or "")
+            if hit_id in fetched:
+                fetched[hit_id] = itunes_podcast_fields(hit)
+        itunes_cache_put({f"id:{i}": result for i, result in fetched.items()})
+        found.update(fetched)
+    return {i: result for i, result in found.items() if result}
 
 
 def normalize_text_key(value: str) -> str:
@@ -969,22 +1376,36 @@ def normalize_text_key(value: str) -> str:
     return cleaned
 
 
-def parse_feed_podcast_episodes(feed_url: str, fallback_title: str, fallback_author: str) -> list[dict[str, Any]]:
-    if not feed_url:
-        return []
-    try:
-        resp = requests.get(feed_url, timeout=25)
-        resp.raise_for_status()
-        root = ET.fromstring(resp.content)
-    except Exception:
-        return []
-
-    entries = root.findall(".//item")
-    if not entries:
-        entries = root.findall(".//{http://www.w3.org/2005/Atom}entry")
+FEED_ENTRY_TAGS = ("item", "{http://www.w3.org/2005/Atom}entry")
+
+
+def iter_feed_podcast_episodes(
+    source: Any,
+    fallback_title: str,
+    fallback_author: str,
+    limit: int = 0,
+    since_ts: float = 0.0,
+) -> Iterator[dict[str, Any]]:
+    """Yield episodes from an RSS/Atom feed read incrementally from `source`.
+
+    Each item is dropped from the tree once it has been turned into a dict, so
+    memory stays bounded by a single item regardless of feed size. Parsing
+    stops after `limit` episodes, or at the first episode published before
+    `since_ts` (feeds list newest first).
+    """
+    stack: list[ET.Element] = []
+    idx = 0
+    for event, item in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(item)
+            continue
+        stack.pop()
+        if item.tag not in FEED_ENTRY_TAGS:
+            continue
+        if stack:
+            stack[-1].remove(item)
+        idx += 1
 
-    episodes: list[dict[str, Any]] = []
-    for idx, item in enumerate(entries, start=1):
         def _txt(path: str) -> str:
             elem = item.find(path)
             return (elem.text or "").strip() if elem is not None and elem.text else ""
@@ -1008,42 +1429,202 @@ def parse_feed_podcast_episodes(feed_url: str, fallback_title: str, fallback_aut
             elif duration_raw.isdigit():
                 duration_sec = float(duration_raw)
 
+        enclosure_url = ""
+        enc = item.find("enclosure")
+        if enc is not None:
+            enclosure_url = (enc.attrib.get("url") or "").strip()
         image_url = ""
         img = item.find("{http://www.itunes.com/dtds/podcast-1.0.dtd}image")
         if img is not None:
             image_url = (img.attrib.get("href") or "").strip()
         if not image_url:
-            enc = item.find("enclosure")
-            if enc is not None:
-                image_url = (enc.attrib.get("url") or "").strip()
+            image_url = enclosure_url
 
         external_id = guid or f"itunes:{hashlib.sha1((title + '|' + pub).encode('utf-8')).hexdigest()}"
-        episodes.append(
-            {
-                "external_id": external_id[:64],
-                "title": title,
-                "published_at": pub,
-                "author": author or fallback_author,
-                "duration_sec": duration_sec if duration_sec > 0 else None,
-                "image_url": image_url,
-                "podcast_title": fallback_title,
-            }
-        )
+        item.clear()
+        if since_ts > 0 and parse_published_timestamp(pub) < since_ts:
+            return
+        yield {
+            "external_id": external_id[:64],
+            "guid": guid,
+            "enclosure_url": enclosure_url,
+            "title": title,
+            "published_at": pub,
+            "author": author or fallback_author,
+            "duration_sec": duration_sec if duration_sec > 0 else None,
+            "image_url": image_url,
+            "podcast_title": fallback_title,
+        }
+        if limit > 0 and idx >= limit:
+            return
+
+
+def load_podcast_feed(feed_url: str) -> list[dict[str, Any]]:
+    """Parsed episodes of a podcast feed, backed by ui_podcast_feed_cache.
+
+    The cache row keeps the feed's ETag/Last-Modified, so a stale entry is
+    revalidated with a conditional request and parsing is skipped on 304. A
+    failed fetch falls back to the cached copy. Uses its own connection so
+    enrichment workers can call it concurrently.
+    """
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            url_hash = hashlib.sha1(feed_url.encode("utf-8")).hexdigest()
+            cur.execute(
+                "SELECT etag, last_modified, episodes_json, checked_at_ms FROM ui_podcast_feed_cache WHERE url_hash=%s",
+                (url_hash,),
+            )
+            cached = cur.fetchone()
+            cached_episodes: list[dict[str, Any]] | None = None
+            if cached:
+                try:
+                    cached_episodes = json.loads(cached["episodes_json"] or "[]")
+                except ValueError:
+                    cached_episodes = None
+
+            now_ms = int(time.time() * 1000)
+            if cached_episodes is not None and now_ms - int(cached["checked_at_ms"] or 0) < PODCAST_FEED_CACHE_TTL_SECONDS * 1000:
+                episodes = cached_episodes
+            else:
+                headers: dict[str, str] = {}
+                if cached_episodes is not None:
+                    if cached.get("etag"):
+                        headers["If-None-Match"] = str(cached["etag"])
+                    if cached.get("last_modified"):
+                        headers["If-Modified-Since"] = str(cached["last_modified"])
+                try:
+                    with host_slot(feed_url), http_get(feed_url, headers=headers, timeout=25, stream=True) as resp:
+                        if resp.status_code == 304 and cached_episodes is not None:
+                            episodes = cached_episodes
+                        else:
+                            resp.raise_for_status()
+                            resp.raw.decode_content = True
+                            # Fallback title/author are applied per caller, not cached.
+                            episodes = list(iter_feed_podcast_episodes(resp.raw, "", "", limit=PODCAST_FEED_MAX_EPISODES))
+                            etag = str(resp.headers.get("ETag") or "")[:512]
+                            last_modified = str(resp.headers.get("Last-Modified") or "")[:128]
+                    if episodes is cached_episodes:
+                        cur.execute(
+                            "UPDATE ui_podcast_feed_cache SET checked_at_ms=%s WHERE url_hash=%s",
+                            (now_ms, url_hash),
+                        )
+                    else:
+                        cur.execute(
+                            """
+                            INSERT INTO ui_podcast_feed_cache
+                            (url_hash, feed_url, etag, last_modified, episodes_json, fetched_at_ms, checked_at_ms)
+                            VALUES (%s,%s,NULLIF(%s,''),NULLIF(%s,''),%s,%s,%s)
+                            ON DUPLICATE KEY UPDATE
+                              feed_url=VALUES(feed_url),
+                              etag=VALUES(etag),
+                              last_modified=VALUES(last_modified),
+                              episodes_json=VALUES(episodes_json),
+                              fetched_at_ms=VALUES(fetched_at_ms),
+                              checked_at_ms=VALUES(checked_at_ms)
+                            """,
+                            (
+                                url_hash,
+                                feed_url,
+                                etag,
+                                last_modified,
+                                json.dumps(episodes, separators=(",", ":")),
+                                now_ms,
+                                now_ms,
+                            ),
+                        )
+                except Exception:
+                    episodes = cached_episodes or []
     return episodes
 
 
-def match_abs_episode(itunes_ep: dict[str, Any], abs_episodes: list[dict[str, Any]]) -> str | None:
+def fetch_podcast_feed_episodes(
+    feed_url: str,
+    fallback_title: str,
+    fallback_author: str,
+    run_cache: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Episodes of a podcast feed, fetched at most once per import run.
+
+    Workers asking for a URL that is already being fetched wait for that fetch
+    instead of issuing their own.
+    """
+    if not feed_url:
+        return []
+
+    if run_cache is None:
+        episodes = load_podcast_feed(feed_url)
+    else:
+        with FEED_RUN_CACHE_LOCK:
+            slot = run_cache.setdefault(feed_url, {"lock": threading.Lock(), "episodes": None})
+        with slot["lock"]:
+            if slot["episodes"] is None:
+                slot["episodes"] = load_podcast_feed(feed_url)
+        episodes = slot["episodes"]
+
+    return [
+        {**ep, "author": ep.get("author") or fallback_author, "podcast_title": fallback_title}
+        for ep in episodes
+    ]
+
+
+def build_abs_episode_index(abs_episodes: list[dict[str, Any]]) -> dict[str, Any]:
+    """Lookup tables for match_abs_episode, built once per show.
+
+    The first ABS episode wins on duplicate keys, as the previous linear scans
+    did. Durations are kept sorted for a bisect-based proximity lookup.
+    """
+    index: dict[str, Any] = {"title": {}, "pub": {}, "guid": {}, "enclosure": {}, "duration": []}
+    for ep in abs_episodes:
+        ep_id = str(ep.get("id") or "")
+        if not ep_id:
+            continue
+        title_key = normalize_text_key(str(ep.get("title") or ""))
+        if title_key:
+            index["title"].setdefault(title_key, ep_id)
+        pub_key = str(ep.get("pub") or "")[:16]
+        if pub_key:
+            index["pub"].setdefault(pub_key, ep_id)
+        guid = str(ep.get("guid") or "").strip()
+        if guid:
+            index["guid"].setdefault(guid, ep_id)
+        enclosure_url = str(ep.get("enclosure_url") or "").strip()
+        if enclosure_url:
+            index["enclosure"].setdefault(enclosure_url, ep_id)
+        duration = float(ep.get("duration") or 0.0)
+        if duration > 0:
+            index["duration"].append((duration, ep_id))
+    index["duration"].sort()
+    return index
+
+
+def match_abs_episode(itunes_ep: dict[str, Any], index: dict[str, Any]) -> str | None:
     it_title = normalize_text_key(str(itunes_ep.get("title") or ""))
+    if it_title and it_title in index["title"]:
+        return index["title"][it_title]
     it_pub = str(itunes_ep.get("published_at") or "")[:16]
-    if not abs_episodes:
-        return None
-    for ep in abs_episodes:
-        if normalize_text_key(str(ep.get("title") or "")) == it_title and it_title:
-            return str(ep.get("id") or "") or None
-    if it_pub:
-        for ep in abs_episodes:
-            if str(ep.get("pub") or "")[:16] == it_pub:
-                return str(ep.get("id") or "") or None
+    if it_pub and it_pub in index["pub"]:
+        return index["pub"][it_pub]
+
+    for fallback in PODCAST_MATCH_FALLBACKS:
+        if fallback == "guid":
+            guid = str(itunes_ep.get("guid") or "").strip()
+            if guid and guid in index["guid"]:
+                return index["guid"][guid]
+        elif fallback == "enclosure":
+            enclosure_url = str(itunes_ep.get("enclosure_url") or "").strip()
+            if enclosure_url and enclosure_url in index["enclosure"]:
+                return index["enclosure"][enclosure_url]
+        elif fallback == "duration":
+            duration = float(itunes_ep.get("duration_sec") or 0.0)
+            durations = index["duration"]
+            if duration <= 0 or not durations:
+                continue
+            tolerance = PODCAST_MATCH_DURATION_TOLERANCE_SECONDS
+            lo = bisect.bisect_left(durations, (duration - tolerance, ""))
+            hi = bisect.bisect_right(durations, (duration + tolerance, "\uffff"))
+            # Only an unambiguous duration match counts.
+            if hi - lo == 1:
+                return durations[lo][1]
     return None
 
 
@@ -1059,17 +1640,18 @@ def audible_podcast_fallback_episodes(title: str, author: str, limit: int = 50)
         return []
 
     try:
-        response = requests.get(
-            f"{base_url}/1.0/catalog/products",
-            params={
-                "num_results": limit,
-                "keywords": query,
-                "response_groups": "product_desc,contributors,product_attrs,media,series",
-                "marketplace": marketplace,
-            },
-            headers={"Authorization": f"Bearer {bearer}"},
-            timeout=18,
-        )
+        with host_slot(base_url):
+            response = http_get(
+                f"{base_url}/1.0/catalog/products",
+                params={
+                    "num_results": limit,
+                    "keywords": query,
+                    "response_groups": "product_desc,contributors,product_attrs,media,series",
+                    "marketplace": marketplace,
+                },
+                headers={"Authorization": f"Bearer {bearer}"},
+                timeout=18,
+            )
         response.raise_for_status()
         products = response.json().get("products", [])
     except Exception:
@@ -1124,11 +1706,215 @@ def audible_podcast_fallback_episodes(title: str, author: str, limit: int = 50)
     return episodes
 
 
+def collect_podcast_show(
+    cred: dict[str, str],
+    item: dict[str, Any],
+    enrich_podcasts: bool,
+    feed_run_cache: dict[str, dict[str, Any]],
+    itunes_by_id: dict[str, dict[str, str]],
+) -> dict[str, Any]:
+    """Network half of a podcast import; runs on an enrichment worker.
+
+    Gathers show metadata (optionally enriched via iTunes, using the batch
+    lookup result when ABS already knows the iTunes id), the episodes ABS
+    already has and the feed episodes, falling back to Audible and then to the
+    ABS episode list. Nothing is written here.
+    """
+    item_id = str(item.get("id") or "")
+    metadata = ((item.get("media") or {}).get("metadata") or {})
+    title = str(metadata.get("title") or "")
+    author = str(metadata.get("author") or metadata.get("authorName") or "")
+    feed_url = str(metadata.get("feedUrl") or "")
+    image_url = str(metadata.get("imageUrl") or "")
+    itunes_id = str(metadata.get("itunesId") or "")
+    itunes_page_url = str(metadata.get("itunesPageUrl") or "")
+    release_date = str(metadata.get("releaseDate") or "")
+    language = str(metadata.get("language") or "")
+
+    if enrich_podcasts and (not image_url or not itunes_id):
+        enrich = itunes_by_id.get(itunes_id) or itunes_lookup_podcast(title, author)
+        image_url = image_url or enrich.get("image_url", "")
+        feed_url = feed_url or enrich.get("feed_url", "")
+        itunes_id = itunes_id or enrich.get("itunes_id", "")
+        itunes_page_url = itunes_page_url or enrich.get("itunes_page_url", "")
+
+    abs_episodes: list[dict[str, Any]] = []
+    try:
+        with host_slot(cred["url"]):
+            item_detail = abs_get_json(cred["url"], cred["token"], f"/api/items/{item_id}")
+        item_media = (item_detail.get("media") or {}) if isinstance(item_detail, dict) else {}
+        eps = item_media.get("episodes", []) if isinstance(item_media, dict) else []
+        for ep in eps:
+            abs_episodes.append(
+                {
+                    "id": str(ep.get("id") or ""),
+                    "title": str(ep.get("title") or ""),
+                    "pub": str(ep.get("pubDate") or ep.get("publishedAt") or ""),
+                    "guid": str(ep.get("guid") or ""),
+                    "enclosure_url": str((ep.get("enclosure") or {}).get("url") or ""),
+                    "duration": float(ep.get("duration") or (ep.get("audioFile") or {}).get("duration") or 0.0),
+                }
+            )
+    except Exception:
+        abs_episodes = []
+
+    feed_eps = fetch_podcast_feed_episodes(feed_url, title, author, feed_run_cache)
+    episode_source = "itunes"
+    if not feed_eps:
+        feed_eps = audible_podcast_fallback_episodes(title, author, limit=80)
+        if feed_eps:
+            episode_source = "audible"
+    if not feed_eps:
+        feed_eps = [
+            {
+                "external_id": str(ep.get("id") or "")[:64],
+                "title": str(ep.get("title") or ""),
+                "published_at": str(ep.get("pub") or ""),
+                "author": author,
+                "duration_sec": None,
+                "image_url": image_url,
+                "podcast_title": title,
+                "source": "abs",
+            }
+            for ep in abs_episodes
+            if str(ep.get("id") or "")
+        ]
+        if feed_eps:
+            episode_source = "abs"
+
+    return {
+        "item_id": item_id,
+        "title": title,
+        "author": author,
+        "feed_url": feed_url,
+        "image_url": image_url,
+        "itunes_id": itunes_id,
+        "itunes_page_url": itunes_page_url,
+        "release_date": release_date,
+        "language": language,
+        "abs_episodes": abs_episodes,
+        "feed_eps": feed_eps,
+        "episode_source": episode_source,
+    }
+
+
+def store_podcast_show(cur, owner_user_id: int, target_id: str, show: dict[str, Any], enrich_podcasts: bool) -> int:
+    """Write one collected show and sync its episodes; returns the episode count."""
+    item_id = show["item_id"]
+    title = show["title"]
+    author = show["author"]
+    image_url = show["image_url"]
+    episode_source = show["episode_source"]
+    abs_index = build_abs_episode_index(show["abs_episodes"])
+    cur.execute(
+        """
+        INSERT INTO ui_podcast_shows
+        (owner_user_id, target_id, library_item_id, title, author, feed_url, image_url, itunes_id, itunes_page_url, release_date, language, source)
+        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+        ON DUPLICATE KEY UPDATE
+          title=VALUES(title),
+          author=VALUES(author),
+          feed_url=VALUES(feed_url),
+          image_url=VALUES(image_url),
+          itunes_id=VALUES(itunes_id),
+          itunes_page_url=VALUES(itunes_page_url),
+          release_date=VALUES(release_date),
+          language=VALUES(language),
+          source=VALUES(source),
+          updated_at=CURRENT_TIMESTAMP
+        """,
+        (
+            owner_user_id,
+            target_id,
+            item_id,
+            title,
+            author,
+            show["feed_url"],
+            image_url,
+            show["itunes_id"],
+            show["itunes_page_url"],
+            show["release_date"],
+            show["language"],
+            "itunes" if enrich_podcasts else "abs",
+        ),
+    )
+
+    # Diff against what is stored: only new or changed episodes are written,
+    # and rows that left the feed are deleted by id.
+    cur.execute(
+        """
+        SELECT id, episode_id, fingerprint
+        FROM ui_podcast_episodes
+        WHERE owner_user_id=%s AND target_id=%s AND library_item_id=%s
+        """,
+        (owner_user_id, target_id, item_id),
+    )
+    stored = {str(row["episode_id"]): row for row in cur.fetchall()}
+
+    episode_rows: dict[str, tuple[Any, ...]] = {}
+    for ep in show["feed_eps"]:
+        episode_id = str(ep.get("external_id") or "")[:64]
+        if not episode_id:
+            continue
+        abs_episode_id = match_abs_episode(ep, abs_index)
+        duration_sec = float(ep.get("duration_sec") or 0.0)
+        values = (
+            abs_episode_id,
+            "present" if abs_episode_id else "missing",
+            title,
+            str(ep.get("title") or ""),
+            str(ep.get("author") or author),
+            str(ep.get("published_at") or ""),
+            duration_sec if duration_sec > 0 else None,
+            str(ep.get("image_url") or image_url or ""),
+            str(ep.get("source") or episode_source),
+        )
+        fingerprint = hashlib.sha1(json.dumps(values, separators=(",", ":")).encode("utf-8")).hexdigest()
+        episode_rows[episode_id] = (owner_user_id, target_id, item_id, episode_id, *values, fingerprint)
+
+    changed_rows = [
+        row
+        for episode_id, row in episode_rows.items()
+        if episode_id not in stored or stored[episode_id]["fingerprint"] != row[-1]
+    ]
+    if changed_rows:
+        cur.executemany(
+            """
+            INSERT INTO ui_podcast_episodes
+            (owner_user_id, target_id, library_item_id, episode_id, abs_episode_id, abs_presence, podcast_title, episode_title, author, published_at, duration_sec, image_url, source, fingerprint)
+            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+            ON DUPLICATE KEY UPDATE
+              abs_episode_id=VALUES(abs_episode_id),
+              abs_presence=VALUES(abs_presence),
+              podcast_title=VALUES(podcast_title),
+              episode_title=VALUES(episode_title),
+              author=VALUES(author),
+              published_at=VALUES(published_at),
+              duration_sec=VALUES(duration_sec),
+              image_url=VALUES(image_url),
+              source=VALUES(source),
+              fingerprint=VALUES(fingerprint),
+              updated_at=CURRENT_TIMESTAMP
+            """,
+            changed_rows,
+        )
+
+    if episode_rows:
+        stale_ids = [int(row["id"]) for episode_id, row in stored.items() if episode_id not in episode_rows]
+        for offset in range(0, len(stale_ids), PODCAST_EPISODE_DELETE_CHUNK):
+            chunk = stale_ids[offset:offset + PODCAST_EPISODE_DELETE_CHUNK]
+            placeholders = ",".join(["%s"] * len(chunk))
+            cur.execute(f"DELETE FROM ui_podcast_episodes WHERE id IN ({placeholders})", chunk)
+    return len(episode_rows)
+
+
 def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts: bool, enrich_podcasts: bool = False) -> dict[str, int]:
     creds_map = get_user_target_credentials(owner_user_id)
     stats = {"books": 0, "podcasts": 0, "podcast_episodes": 0}
     if not creds_map:
         return stats
+    # Shows shared between targets point at the same feed; fetch it once.
+    feed_run_cache: dict[str, dict[str, Any]] = {}
 
     with get_conn() as conn:
         with conn.cursor() as cur:
@@ -1168,6 +1954,7 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                         if not results:
                             break
 
+                        podcast_items: list[dict[str, Any]] = []
                         for item in results:
                             item_id = str(item.get("id") or "")
                             item_media_type = str(item.get("mediaType") or media_type or "").lower()
@@ -1226,6 +2013,7 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                                       series_name=VALUES(series_name),
                                       published_year=VALUES(published_year),
                                       duration_sec=VALUES(duration_sec),
+                                      identity_hash=NULL,
                                       updated_at=CURRENT_TIMESTAMP
                                     """,
                                     (
@@ -1261,8 +2049,8 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                                         cur.execute(
                                             """
                                             INSERT INTO progress_latest
-                                            (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
-                                            VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull')
+                                            (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source, change_seq)
+                                            VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull',NEXTVAL(progress_change_seq))
                                             ON DUPLICATE KEY UPDATE
                                               server_id=VALUES(server_id),
                                               principal_id=VALUES(principal_id),
@@ -1275,7 +2063,8 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                                               started_at_ms=VALUES(started_at_ms),
                                               finished_at_ms=VALUES(finished_at_ms),
                                               last_update_ms=VALUES(last_update_ms),
-                                              source=VALUES(source)
+                                              source=VALUES(source),
+                                              change_seq=VALUES(change_seq)
                                             """,
                                             (
                                                 target_id,
@@ -1296,7 +2085,7 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                                         )
                                         cur.execute(
                                             """
-                                            INSERT INTO progress_history
+                                            INSERT IGNORE INTO progress_history
                                             (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
                                             VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull')
                                             """,
@@ -1319,150 +2108,27 @@ def import_abs_catalog(owner_user_id: int, import_books: bool, import_podcasts:
                                         )
 
                             if item_media_type == "podcast" and import_podcasts:
-                                author = str(metadata.get("author") or metadata.get("authorName") or "")
-                                feed_url = str(metadata.get("feedUrl") or "")
-                                image_url = str(metadata.get("imageUrl") or "")
-                                itunes_id = str(metadata.get("itunesId") or "")
-                                itunes_page_url = str(metadata.get("itunesPageUrl") or "")
-                                release_date = str(metadata.get("releaseDate") or "")
-                                language = str(metadata.get("language") or "")
-
-                                if enrich_podcasts and (not image_url or not itunes_id):
-                                    enrich = itunes_lookup_podcast(title, author)
-                                    image_url = image_url or enrich.get("image_url", "")
-                                    feed_url = feed_url or enrich.get("feed_url", "")
-                                    itunes_id = itunes_id or enrich.get("itunes_id", "")
-                                    itunes_page_url = itunes_page_url or enrich.get("itunes_page_url", "")
-
-                                cur.execute(
-                                    """
-                                    INSERT INTO ui_podcast_shows
-                                    (owner_user_id, target_id, library_item_id, title, author, feed_url, image_url, itunes_id, itunes_page_url, release_date, language, source)
-                                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                                    ON DUPLICATE KEY UPDATE
-                                      title=VALUES(title),
-                                      author=VALUES(author),
-                                      feed_url=VALUES(feed_url),
-                                      image_url=VALUES(image_url),
-                                      itunes_id=VALUES(itunes_id),
-                                      itunes_page_url=VALUES(itunes_page_url),
-                                      release_date=VALUES(release_date),
-                                      language=VALUES(language),
-                                      source=VALUES(source),
-                                      updated_at=CURRENT_TIMESTAMP
-                                    """,
-                                    (
-                                        owner_user_id,
-                                        target_id,
-                                        item_id,
-                                        title,
-                                        author,
-                                        feed_url,
-                                        image_url,
-                                        itunes_id,
-                                        itunes_page_url,
-                                        release_date,
-                                        language,
-                                        "itunes" if enrich_podcasts else "abs",
-                                    ),
+                                podcast_items.append(item)
+
+                        if podcast_items:
+                            itunes_by_id: dict[str, dict[str, str]] = {}
+                            if enrich_podcasts:
+                                # Shows that already carry an iTunes id only lack artwork;
+                                # resolve those with batched /lookup calls up front.
+                                podcast_meta = [((item.get("media") or {}).get("metadata") or {}) for item in podcast_items]
+                                itunes_by_id = itunes_lookup_ids(
+                                    [str(meta.get("itunesId") or "") for meta in podcast_meta if not meta.get("imageUrl")]
                                 )
-                                stats["podcasts"] += 1
-
-                                abs_episodes: list[dict[str, Any]] = []
-                                try:
-                                    item_detail = abs_get_json(cred["url"], cred["token"], f"/api/items/{item_id}")
-                                    item_media = (item_detail.get("media") or {}) if isinstance(item_detail, dict) else {}
-                                    eps = item_media.get("episodes", []) if isinstance(item_media, dict) else []
-                                    for ep in eps:
-                                        abs_episodes.append(
-                                            {
-                                                "id": str(ep.get("id") or ""),
-                                                "title": str(ep.get("title") or ""),
-                                                "pub": str(ep.get("pubDate") or ep.get("publishedAt") or ""),
-                                            }
-                                        )
-                                except Exception:
-                                    abs_episodes = []
-
-                                feed_eps = parse_feed_podcast_episodes(feed_url, title, author)
-                                episode_source = "itunes"
-                                if not feed_eps:
-                                    feed_eps = audible_podcast_fallback_episodes(title, author, limit=80)
-                                    if feed_eps:
-                                        episode_source = "audible"
-                                if not feed_eps:
-                                    feed_eps = [
-                                        {
-                                            "external_id": str(ep.get("id") or "")[:64],
-                                            "title": str(ep.get("title") or ""),
-                                            "published_at": str(ep.get("pub") or ""),
-                                            "author": author,
-                                            "duration_sec": None,
-                                            "image_url": image_url,
-                                            "podcast_title": title,
-                                            "source": "abs",
-                                        }
-                                        for ep in abs_episodes
-                                        if str(ep.get("id") or "")
-                                    ]
-                                    if feed_eps:
-                                        episode_source = "abs"
-
-                                imported_ids: list[str] = []
-                                for ep in feed_eps:
-                                    episode_id = str(ep.get("external_id") or "")[:64]
-                                    if not episode_id:
-                                        continue
-                                    abs_episode_id = match_abs_episode(ep, abs_episodes)
-                                    abs_presence = "present" if abs_episode_id else "missing"
-                                    imported_ids.append(episode_id)
-                                    cur.execute(
-                                        """
-                                        INSERT INTO ui_podcast_episodes
-                                        (owner_user_id, target_id, library_item_id, episode_id, abs_episode_id, abs_presence, podcast_title, episode_title, author, published_at, duration_sec, image_url, source)
-                                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                                        ON DUPLICATE KEY UPDATE
-                                          abs_episode_id=VALUES(abs_episode_id),
-                                          abs_presence=VALUES(abs_presence),
-                                          podcast_title=VALUES(podcast_title),
-                                          episode_title=VALUES(episode_title),
-                                          author=VALUES(author),
-                                          published_at=VALUES(published_at),
-                                          duration_sec=VALUES(duration_sec),
-                                          image_url=VALUES(image_url),
-                                          source=VALUES(source),
-                                          updated_at=CURRENT_TIMESTAMP
-                                        """,
-                                        (
-                                            owner_user_id,
-                                            target_id,
-                                            item_id,
-                                            episode_id,
-                                            abs_episode_id,
-                                            abs_presence,
-                                            title,
-                                            str(ep.get("title") or ""),
-                                            str(ep.get("author") or author),
-                                            str(ep.get("published_at") or ""),
-                                            float(ep.get("duration_sec") or 0.0) if float(ep.get("duration_sec") or 0.0) > 0 else None,
-                                            str(ep.get("image_url") or image_url or ""),
-                                            str(ep.get("source") or episode_source),
-                                        ),
-                                    )
-                                    stats["podcast_episodes"] += 1
-
-                                if imported_ids:
-                                    placeholders = ",".join(["%s"] * len(imported_ids))
-                                    cur.execute(
-                                        f"""
-                                        DELETE FROM ui_podcast_episodes
-                                        WHERE owner_user_id=%s
-                                          AND target_id=%s
-                                          AND library_item_id=%s
-                                          AND episode_id NOT IN ({placeholders})
-                                        """,
-                                        [owner_user_id, target_id, item_id, *imported_ids],
-                                    )
+                            with ThreadPoolExecutor(max_workers=PODCAST_IMPORT_WORKERS) as pool:
+                                futures = [
+                                    pool.submit(collect_podcast_show, cred, item, enrich_podcasts, feed_run_cache, itunes_by_id)
+                                    for item in podcast_items
+                                ]
+                                for future in as_completed(futures):
+                                    show = future.result()
+                                    stats["podcast_episodes"] += store_podcast_show(cur, owner_user_id, target_id, show, enrich_podcasts)
+                                    stats["podcasts"] += 1
+
                         page += 1
     return stats
 
@@ -1477,26 +2143,30 @@ def _fetch_abs_book_item_ids(base_url: str, token: str) -> set[str]:
         library_id = str(lib.get("id") or "")
         if not library_id:
             continue
-        page = 0
-        while True:
-            items_payload = abs_get_optional_json(
-                base_url,
-                token,
-                f"/api/libraries/{library_id}/items",
-                {"limit": 200, "page": page, "minified": 1},
-            )
-            if not isinstance(items_payload, dict):
-                break
-            results = items_payload.get("results", [])
-            if not isinstance(results, list) or not results:
-                break
+        # The first page reports the total; the remaining pages are fetched concurrently.
+        items_path = f"/api/libraries/{library_id}/items"
+        first_page = abs_get_optional_json(base_url, token, items_path, {"limit": 200, "page": 0, "minified": 1})
+        if not isinstance(first_page, dict):
+            continue
+        pages = [first_page]
+        total = parse_int(first_page.get("total"), 0)
+        if total > 200:
+            pages.extend(
+                fetch_optional_json_many(
+                    base_url,
+                    token,
+                    [(items_path, {"limit": 200, "page": page, "minified": 1}) for page in range(1, (total + 199) // 200)],
+                    ABS_ASYNC_CONCURRENCY,
+                )
+            )
+        for items_payload in pages:
+            results = items_payload.get("results", []) if isinstance(items_payload, dict) else []
+            if not isinstance(results, list):
+                continue
             for item in results:
                 item_id = str(item.get("id") or "")
                 if item_id:
                     item_ids.add(item_id)
-            if len(results) < 200:
-                break
-            page += 1
     return item_ids
 
 
@@ -1540,15 +2210,19 @@ def rebuild_progress_from_abs(owner_user_id: int) -> dict[str, int]:
                     """,
                     (owner_user_id, target_id),
                 )
-                rows = cur.fetchall()
+                rows = [row for row in cur.fetchall() if str(row.get("library_item_id") or "")]
+                progress_payloads = fetch_optional_json_many(
+                    base_url,
+                    token,
+                    [(f"/api/me/progress/{row['library_item_id']}", None) for row in rows],
+                    ABS_ASYNC_CONCURRENCY,
+                )
 
-                for row in rows:
+                for row, progress_payload in zip(rows, progress_payloads):
                     item_id = str(row.get("library_item_id") or "")
-                    if not item_id:
-                        continue
                     stats["scanned"] += 1
 
-                    progress_payload = abs_get_optional_json(base_url, token, f"/api/me/progress/{item_id}") or {}
+                    progress_payload = progress_payload or {}
                     if not progress_payload:
                         stats["missing"] += 1
                         continue
@@ -1577,8 +2251,8 @@ def rebuild_progress_from_abs(owner_user_id: int) -> dict[str, int]:
                     cur.execute(
                         """
                         INSERT INTO progress_latest
-                        (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
-                        VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull')
+                        (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source, change_seq)
+                        VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull',NEXTVAL(progress_change_seq))
                         ON DUPLICATE KEY UPDATE
                           server_id=VALUES(server_id),
                           principal_id=VALUES(principal_id),
@@ -1591,7 +2265,8 @@ def rebuild_progress_from_abs(owner_user_id: int) -> dict[str, int]:
                           started_at_ms=VALUES(started_at_ms),
                           finished_at_ms=VALUES(finished_at_ms),
                           last_update_ms=VALUES(last_update_ms),
-                          source=VALUES(source)
+                          source=VALUES(source),
+                          change_seq=VALUES(change_seq)
                         """,
                         (
                             target_id,
@@ -1612,7 +2287,7 @@ def rebuild_progress_from_abs(owner_user_id: int) -> dict[str, int]:
                     )
                     cur.execute(
                         """
-                        INSERT INTO progress_history
+                        INSERT IGNORE INTO progress_history
                         (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
                         VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),%s,%s,%s,%s,%s,%s,%s,'remote_pull')
                         """,
@@ -1787,6 +2462,53 @@ def cleanup_collected_library(owner_user_id: int) -> dict[str, int]:
     return stats
 
 
+def get_progress_summary(cur: Any, target_ids: list[str]) -> dict[str, int]:
+    key = tuple(sorted(set(target_ids)))
+    placeholders = ",".join(["%s"] * len(key))
+    cur.execute(
+        f"""
+        SELECT target_id, MAX(change_seq) AS head
+        FROM progress_latest
+        WHERE target_id IN ({placeholders})
+        GROUP BY target_id
+        """,
+        key,
+    )
+    head = max((int(row.get("head") or 0) for row in cur.fetchall()), default=0)
+    with PROGRESS_SUMMARY_CACHE_LOCK:
+        cached = PROGRESS_SUMMARY_CACHE.get(key)
+        if cached and cached[0] == head:
+            PROGRESS_SUMMARY_CACHE.move_to_end(key)
+            return dict(cached[1])
+
+    cur.execute(
+        f"""
+        SELECT
+          COUNT(*) AS total_count,
+          SUM(CASE WHEN (COALESCE(progress,0) = 0 AND COALESCE(is_finished,0) = 0) THEN 1 ELSE 0 END) AS backlog_count,
+          SUM(CASE WHEN (COALESCE(progress,0) > 0 AND COALESCE(progress,0) < 0.98 AND COALESCE(is_finished,0) = 0) THEN 1 ELSE 0 END) AS in_progress_count,
+          SUM(CASE WHEN (COALESCE(is_finished,0) = 1 OR COALESCE(progress,0) >= 0.98) THEN 1 ELSE 0 END) AS completed_count
+        FROM progress_latest
+        WHERE target_id IN ({placeholders})
+          AND episode_id = ''
+        """,
+        key,
+    )
+    stats = cur.fetchone() or {}
+    summary = {
+        "total": int(stats.get("total_count") or 0),
+        "not_started": int(stats.get("backlog_count") or 0),
+        "in_progress": int(stats.get("in_progress_count") or 0),
+        "completed": int(stats.get("completed_count") or 0),
+    }
+    with PROGRESS_SUMMARY_CACHE_LOCK:
+        PROGRESS_SUMMARY_CACHE[key] = (head, summary)
+        PROGRESS_SUMMARY_CACHE.move_to_end(key)
+        while len(PROGRESS_SUMMARY_CACHE) > PROGRESS_SUMMARY_CACHE_SIZE:
+            PROGRESS_SUMMARY_CACHE.popitem(last=False)
+    return dict(summary)
+
+
 def _normalize_identifier(value: str) -> str:
     return "".join(ch for ch in (value or "").strip().upper() if ch.isalnum())
 
@@ -1884,6 +2606,7 @@ def manual_match_items(
                   series_name=COALESCE(NULLIF(VALUES(series_name),''), series_name),
                   published_year=COALESCE(VALUES(published_year), published_year),
                   duration_sec=COALESCE(VALUES(duration_sec), duration_sec),
+                  identity_hash=NULL,
                   updated_at=CURRENT_TIMESTAMP
                 """,
                 (
@@ -1899,6 +2622,11 @@ def manual_match_items(
                     ref_duration if ref_duration > 0 else None,
                 ),
             )
+            # Re-cluster right away (assign_identity_cluster is the stored procedure the
+            # sync engine installs) so matching and propagation see the link before the
+            # next sync cycle.
+            cur.execute("CALL assign_identity_cluster(%s, %s)", (ref_target_id, ref_library_item_id))
+            cur.execute("CALL assign_identity_cluster(%s, %s)", (source_target_id, source_library_item_id))
 
     request_manual_sync()
     return (True, f"Manual match saved using key {canonical_key}.")
@@ -1939,11 +2667,15 @@ def collect_matching_rows(owner_user_id: int) -> tuple[list[dict[str, Any]], lis
                   c.asin,
                   c.collection_status,
                   COALESCE(ii.isbn, '') AS isbn,
-                  COALESCE(ii.canonical_key, '') AS canonical_key
+                  COALESCE(ii.canonical_key, '') AS canonical_key,
+                  icm.cluster_id
                 FROM ui_collected_items c
                 LEFT JOIN item_identity ii
                   ON ii.target_id = c.target_id
                  AND ii.library_item_id = c.library_item_id
+                LEFT JOIN identity_cluster_member icm
+                  ON icm.target_id = c.target_id
+                 AND icm.library_item_id = c.library_item_id
                 WHERE c.owner_user_id = %s
                   AND c.media_type = 'book'
                   AND c.target_id IN ({placeholders})
@@ -1953,7 +2685,6 @@ def collect_matching_rows(owner_user_id: int) -> tuple[list[dict[str, Any]], lis
             )
             rows = cur.fetchall()
 
-    keyed_targets: dict[str, set[str]] = {}
     normalized_rows: list[dict[str, Any]] = []
     for row in rows:
         asin_norm = _normalize_identifier(str(row.get("asin") or ""))
@@ -1967,8 +2698,6 @@ def collect_matching_rows(owner_user_id: int) -> tuple[list[dict[str, Any]], lis
         if isbn_norm:
             keys.append(f"isbn:{isbn_norm}")
         target_id = str(row.get("target_id") or "")
-        for key in keys:
-            keyed_targets.setdefault(key, set()).add(target_id)
         normalized_rows.append(
             {
                 **row,
@@ -1987,16 +2716,124 @@ def collect_matching_rows(owner_user_id: int) -> tuple[list[dict[str, Any]], lis
         canonical_key = str(row.get("canonical_key") or "").strip()
         asin_norm = str(row.get("asin_norm") or "").strip()
         isbn_norm = str(row.get("isbn_norm") or "").strip()
-        if not canonical_key and not asin_norm and not isbn_norm:
+        if row.get("cluster_id") is None and not canonical_key and not asin_norm and not isbn_norm:
             unmatched_rows.append(row)
 
     return (normalized_rows, unmatched_rows, target_url_map)
 
 
-def openlibrary_search(query: str) -> list[dict[str, Any]]:
-    response = requests.get(
+def metadata_cache_db_get(cache_key: str) -> list[dict[str, Any]] | None:
+    if not METADATA_CACHE_DB:
+        return None
+    try:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT results_json FROM ui_metadata_cache WHERE cache_key=%s AND expires_at_ms > %s",
+                    (hashlib.sha1(cache_key.encode("utf-8")).hexdigest(), int(time.time() * 1000)),
+                )
+                row = cur.fetchone()
+        return json.loads(row["results_json"]) if row else None
+    except Exception:
+        return None
+
+
+def metadata_cache_db_put(provider: str, cache_key: str, query: str, results: list[dict[str, Any]]) -> None:
+    if not METADATA_CACHE_DB:
+        return
+    now_ms = int(time.time() * 1000)
+    try:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO ui_metadata_cache (cache_key, provider, query, results_json, expires_at_ms)
+                    VALUES (%s,%s,%s,%s,%s)
+                    ON DUPLICATE KEY UPDATE
+                      results_json=VALUES(results_json),
+                      expires_at_ms=VALUES(expires_at_ms)
+                    """,
+                    (
+                        hashlib.sha1(cache_key.encode("utf-8")).hexdigest(),
+                        provider,
+                        query[:512],
+                        json.dumps(results, separators=(",", ":")),
+                        now_ms + METADATA_CACHE_TTL_SECONDS * 1000,
+                    ),
+                )
+                cur.execute("DELETE FROM ui_metadata_cache WHERE expires_at_ms <= %s LIMIT 100", (now_ms,))
+    except Exception:
+        pass
+
+
+def cached_metadata_search(
+    provider: str,
+    query: str,
+    limit: int,
+    fetch: Callable[[str, int], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Search results for (provider, normalized query, limit) through the cache tiers.
+
+    Concurrent callers with the same key wait for the first caller's upstream
+    request. Failures are not cached; waiters see the same exception.
+    """
+    cache_key = f"{provider}:{limit}:{normalize_text_key(query)}"
+    with METADATA_CACHE_LOCK:
+        entry = METADATA_CACHE.get(cache_key)
+        if entry and entry[0] > time.time():
+            METADATA_CACHE.move_to_end(cache_key)
+            METADATA_CACHE_STATS["lru_hits"] += 1
+            return entry[1]
+        flight = METADATA_INFLIGHT.get(cache_key)
+        leader = flight is None
+        if leader:
+            flight = {"event": threading.Event(), "results": None, "error": None}
+            METADATA_INFLIGHT[cache_key] = flight
+        else:
+            METADATA_CACHE_STATS["coalesced"] += 1
+
+    if not leader:
+        flight["event"].wait()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return flight["results"]
+
+    try:
+        results = metadata_cache_db_get(cache_key)
+        if results is not None:
+            stat = "db_hits"
+        else:
+            stat = "misses"
+            results = fetch(query, limit)
+            metadata_cache_db_put(provider, cache_key, query, results)
+        with METADATA_CACHE_LOCK:
+            METADATA_CACHE_STATS[stat] += 1
+            if METADATA_CACHE_SIZE > 0:
+                METADATA_CACHE[cache_key] = (time.time() + METADATA_CACHE_TTL_SECONDS, results)
+                METADATA_CACHE.move_to_end(cache_key)
+                while len(METADATA_CACHE) > METADATA_CACHE_SIZE:
+                    METADATA_CACHE.popitem(last=False)
+        flight["results"] = results
+        return results
+    except Exception as exc:
+        with METADATA_CACHE_LOCK:
+            METADATA_CACHE_STATS["errors"] += 1
+        flight["error"] = exc
+        raise
+    finally:
+        with METADATA_CACHE_LOCK:
+            METADATA_INFLIGHT.pop(cache_key, None)
+        flight["event"].set()
+
+
+def openlibrary_search(query: str, limit: int = 12) -> list[dict[str, Any]]:
+    return cached_metadata_search("openlibrary", query, limit, fetch_openlibrary_search)
+
+
+def fetch_openlibrary_search(query: str, limit: int) -> list[dict[str, Any]]:
+    response = http_get(
         "https://openlibrary.org/search.json",
-        params={"q": query, "limit": 12},
+        params={"q": query, "limit": limit},
         timeout=10,
     )
     response.raise_for_status()
@@ -2025,13 +2862,17 @@ def openlibrary_search(query: str) -> list[dict[str, Any]]:
 
 
 def audible_search(query: str, limit: int = 12) -> list[dict[str, Any]]:
+    if not os.getenv("AUDIBLE_API_BEARER_TOKEN", "").strip():
+        return []
+    return cached_metadata_search("audible", query, limit, fetch_audible_search)
+
+
+def fetch_audible_search(query: str, limit: int) -> list[dict[str, Any]]:
     base_url = os.getenv("AUDIBLE_API_BASE_URL", "https://api.audible.com").rstrip("/")
     bearer = os.getenv("AUDIBLE_API_BEARER_TOKEN", "").strip()
     marketplace = os.getenv("AUDIBLE_MARKETPLACE", "us").strip()
-    if not bearer:
-        return []
 
-    response = requests.get(
+    response = http_get(
         f"{base_url}/1.0/catalog/products",
         params={
             "num_results": limit,
@@ -2108,6 +2949,102 @@ def enrich_with_audible(title: str, author: str, asin: str, isbn: str, series_na
     }
 
 
+def parse_series_index(value: Any) -> float | None:
+    try:
+        return float(value) if str(value or "").strip() else None
+    except ValueError:
+        return None
+
+
+def enrich_pending_books() -> int:
+    """Resolve one batch of pending tracked books; returns the number of rows handled.
+
+    Rows sharing a title/author share one Audible search. When the enriched
+    ASIN/ISBN collides with a book the user already tracks, the pending row is
+    folded into that book instead.
+    """
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id, title, author, asin, isbn, series_name, series_index
+                FROM ui_tracked_books
+                WHERE metadata_source = 'pending'
+                ORDER BY id
+                LIMIT %s
+                """,
+                (ENRICH_BATCH_SIZE,),
+            )
+            rows = cur.fetchall()
+            matches: dict[tuple[str, str], dict[str, str]] = {}
+            for row in rows:
+                title = str(row["title"] or "")
+                author = str(row["author"] or "")
+                query_key = (normalize_text_key(title), normalize_text_key(author))
+                if query_key not in matches:
+                    matches[query_key] = enrich_with_audible(title, author, "", "", "", "")
+                best = matches[query_key]
+                asin = str(row["asin"] or "") or best["asin"]
+                isbn = str(row["isbn"] or "") or best["isbn"]
+                series_name = str(row["series_name"] or "") or best["series_name"]
+                series_index = row["series_index"] if row["series_index"] is not None else parse_series_index(best["series_index"])
+                try:
+                    cur.execute(
+                        """
+                        UPDATE ui_tracked_books
+                        SET asin = NULLIF(%s,''),
+                            isbn = NULLIF(%s,''),
+                            series_name = NULLIF(%s,''),
+                            series_index = %s,
+                            metadata_source = %s
+                        WHERE id = %s
+                        """,
+                        (asin, isbn, series_name, series_index, best["source"], int(row["id"])),
+                    )
+                except pymysql.IntegrityError:
+                    cur.execute(
+                        """
+                        UPDATE ui_tracked_books existing
+                        JOIN ui_tracked_books pending ON pending.id = %s
+                        SET existing.status = IF(pending.status = 'heard', 'heard', existing.status),
+                            existing.progress = GREATEST(existing.progress, pending.progress)
+                        WHERE existing.owner_user_id = pending.owner_user_id
+                          AND existing.id <> pending.id
+                          AND existing.asin <=> NULLIF(%s,'')
+                          AND existing.isbn <=> NULLIF(%s,'')
+                          AND LEFT(existing.title, 191) = LEFT(pending.title, 191)
+                        """,
+                        (int(row["id"]), asin, isbn),
+                    )
+                    cur.execute("DELETE FROM ui_tracked_books WHERE id = %s", (int(row["id"]),))
+    return len(rows)
+
+
+def enrichment_worker_loop() -> None:
+    while True:
+        try:
+            handled = enrich_pending_books()
+        except Exception:
+            handled = 0
+        if handled < ENRICH_BATCH_SIZE:
+            ENRICH_WAKE.wait(ENRICH_POLL_SECONDS)
+            ENRICH_WAKE.clear()
+
+
+def ensure_enrichment_worker() -> None:
+    with ENRICH_WORKER_LOCK:
+        worker = ENRICH_WORKER.get("thread")
+        if worker is None or not worker.is_alive():
+            worker = threading.Thread(target=enrichment_worker_loop, name="metadata-enrichment", daemon=True)
+            worker.start()
+            ENRICH_WORKER["thread"] = worker
+
+
+def queue_book_enrichment() -> None:
+    ensure_enrichment_worker()
+    ENRICH_WAKE.set()
+
+
 @app.before_request
 def before_request() -> Any:
     global SCHEMA_READY
@@ -2116,6 +3053,8 @@ def before_request() -> Any:
     for _ in range(attempts):
         try:
             ensure_ui_schema()
+            # Also picks up books left pending by a previous process.
+            ensure_enrichment_worker()
             return None
         except pymysql.MySQLError:
             SCHEMA_READY = False
@@ -2304,16 +3243,8 @@ def dashboard():
             }
             if effective_target_ids:
                 placeholders = ",".join(["%s"] * len(effective_target_ids))
-                cur.execute(
-                    f"""
-                    SELECT COUNT(*) AS c
-                    FROM progress_latest
-                    WHERE target_id IN ({placeholders})
-                      AND episode_id = ''
-                    """,
-                    tuple(effective_target_ids),
-                )
-                sync_count = int((cur.fetchone() or {}).get("c") or 0)
+                summary = get_progress_summary(cur, effective_target_ids)
+                sync_count = summary["total"]
 
                 cur.execute(
                     f"""
@@ -2375,23 +3306,10 @@ def dashboard():
                         }
                     )
 
-                cur.execute(
-                    f"""
-                    SELECT
-                      SUM(CASE WHEN (COALESCE(progress,0) = 0 AND COALESCE(is_finished,0) = 0) THEN 1 ELSE 0 END) AS backlog_count,
-                      SUM(CASE WHEN (COALESCE(progress,0) > 0 AND COALESCE(progress,0) < 0.98 AND COALESCE(is_finished,0) = 0) THEN 1 ELSE 0 END) AS in_progress_count,
-                      SUM(CASE WHEN (COALESCE(is_finished,0) = 1 OR COALESCE(progress,0) >= 0.98) THEN 1 ELSE 0 END) AS completed_count
-                    FROM progress_latest
-                    WHERE target_id IN ({placeholders})
-                      AND episode_id = ''
-                    """,
-                    tuple(effective_target_ids),
-                )
-                stats = cur.fetchone() or {}
                 sync_category_counts = {
-                    "not_started": int(stats.get("backlog_count") or 0),
-                    "in_progress": int(stats.get("in_progress_count") or 0),
-                    "completed": int(stats.get("completed_count") or 0),
+                    "not_started": summary["not_started"],
+                    "in_progress": summary["in_progress"],
+                    "completed": summary["completed"],
                     "paused": 0,
                     "dropped": 0,
                 }
@@ -2984,6 +3902,263 @@ def matching_view():
     )
 
 
+@app.route("/sync/dead-letter", methods=["GET", "POST"])
+@login_required
+def dead_letter_view():
+    user = current_user()
+    user_id = int(user["id"])
+    target_ids = sorted(get_user_target_urls(user_id).keys())
+    if not target_ids:
+        return render_template("dead_letter.html", user=user, rows=[], circuits=[])
+    target_placeholders = ",".join(["%s"] * len(target_ids))
+
+    if request.method == "POST":
+        if request.form.get("requeue_all") == "1":
+            selected_ids: list[int] = []
+        else:
+            selected_ids = sorted({parse_int(v) for v in request.form.getlist("outbox_id") if parse_int(v) > 0})
+            if not selected_ids:
+                flash("Select at least one update to requeue.", "error")
+                return redirect(url_for("dead_letter_view"))
+
+        id_filter = ""
+        newer_filter = ""
+        id_params: list[Any] = []
+        if selected_ids:
+            id_filter = f" AND d.id IN ({','.join(['%s'] * len(selected_ids))})"
+            newer_filter = f" AND newer.id IN ({','.join(['%s'] * len(selected_ids))})"
+            id_params = list(selected_ids)
+
+        try:
+            with get_conn() as conn:
+                with conn.cursor() as cur:
+                    # A newer update for the same item already owns the pending slot;
+                    # the dead row is obsolete rather than requeueable.
+                    cur.execute(
+                        f"""
+                        UPDATE progress_outbox d
+                        JOIN progress_outbox o
+                          ON o.pending_slot = SHA1(CONCAT_WS('|', d.target_id, d.user_id, d.library_item_id, d.episode_id))
+                        SET d.status = 'superseded'
+                        WHERE d.status = 'dead'
+                          AND d.target_id IN ({target_placeholders}){id_filter}
+                        """,
+                        (*target_ids, *id_params),
+                    )
+                    superseded = int(cur.rowcount or 0)
+                    # Only one open row per item fits the pending slot: of several dead
+                    # rows for the same item being requeued, the newest one wins.
+                    cur.execute(
+                        f"""
+                        UPDATE progress_outbox d
+                        JOIN progress_outbox newer
+                          ON newer.target_id = d.target_id
+                         AND newer.user_id = d.user_id
+                         AND newer.library_item_id = d.library_item_id
+                         AND newer.episode_id = d.episode_id
+                         AND newer.status = 'dead'
+                         AND (
+                           COALESCE(newer.last_update_ms, 0) > COALESCE(d.last_update_ms, 0)
+                           OR (COALESCE(newer.last_update_ms, 0) = COALESCE(d.last_update_ms, 0) AND newer.id > d.id)
+                         ){newer_filter}
+                        SET d.status = 'superseded',
+                            d.last_error = CONCAT('superseded by outbox id ', newer.id)
+                        WHERE d.status = 'dead'
+                          AND d.target_id IN ({target_placeholders}){id_filter}
+                        """,
+                        (*id_params, *target_ids, *id_params),
+                    )
+                    superseded += int(cur.rowcount or 0)
+                    cur.execute(
+                        f"""
+                        UPDATE progress_outbox d
+                        SET d.status = 'pending', d.attempts = 0, d.next_attempt_at = 0, d.last_error = NULL
+                        WHERE d.status = 'dead'
+                          AND d.target_id IN ({target_placeholders}){id_filter}
+                        """,
+                        (*target_ids, *id_params),
+                    )
+                    requeued = int(cur.rowcount or 0)
+                    cur.execute(
+                        f"UPDATE target_circuit SET consecutive_failures = 0, opened_until = 0 WHERE target_id IN ({target_placeholders})",
+                        tuple(target_ids),
+                    )
+        except pymysql.err.IntegrityError:
+            # A sync enqueued a newer update for one of the items in the meantime.
+            flash("Dead-letter requeue raced with a new update; please try again.", "error")
+            return redirect(url_for("dead_letter_view"))
+        if requeued:
+            request_manual_sync()
+        flash(f"Dead-letter requeue finished: {requeued} requeued, {superseded} superseded by newer updates.", "ok")
+        return redirect(url_for("dead_letter_view"))
+
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                  o.id, o.target_id, o.library_item_id, o.episode_id, o.progress, o.is_finished,
+                  o.attempts, o.last_error, o.updated_at,
+                  ii.title, ii.author
+                FROM progress_outbox o
+                LEFT JOIN item_identity ii
+                  ON ii.target_id = o.target_id
+                 AND ii.library_item_id = o.library_item_id
+                WHERE o.status = 'dead'
+                  AND o.target_id IN ({target_placeholders})
+                ORDER BY o.updated_at DESC, o.id DESC
+                LIMIT 500
+                """,
+                tuple(target_ids),
+            )
+            rows = cur.fetchall()
+            cur.execute(
+                f"""
+                SELECT target_id, consecutive_failures, opened_until, last_error
+                FROM target_circuit
+                WHERE target_id IN ({target_placeholders})
+                  AND opened_until > %s
+                ORDER BY target_id
+                """,
+                (*target_ids, int(time.time() * 1000)),
+            )
+            circuits = cur.fetchall()
+    for c in circuits:
+        c["paused_until"] = datetime.fromtimestamp(int(c.get("opened_until") or 0) / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    return render_template("dead_letter.html", user=user, rows=rows, circuits=circuits)
+
+
+def get_listening_stats(target_ids: list[str]) -> dict[str, Any]:
+    # Reads the listening_* rollups only (maintained by abshelflife-sync);
+    # books finished on several targets count once per canonical identity.
+    stats: dict[str, Any] = {"hours_7d": 0.0, "hours_30d": 0.0, "books_30d": 0, "weekly": [], "monthly": [], "targets": []}
+    if not target_ids:
+        return stats
+    placeholders = ",".join(["%s"] * len(target_ids))
+    params = tuple(target_ids)
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                  COALESCE(SUM(IF(day >= UTC_DATE() - INTERVAL 6 DAY, listened_sec, 0)), 0) AS sec_7d,
+                  COALESCE(SUM(listened_sec), 0) AS sec_30d
+                FROM listening_user_daily
+                WHERE target_id IN ({placeholders})
+                  AND day >= UTC_DATE() - INTERVAL 29 DAY
+                """,
+                params,
+            )
+            totals = cur.fetchone() or {}
+            stats["hours_7d"] = round(float(totals.get("sec_7d") or 0) / 3600, 1)
+            stats["hours_30d"] = round(float(totals.get("sec_30d") or 0) / 3600, 1)
+
+            cur.execute(
+                f"""
+                SELECT COUNT(DISTINCT COALESCE(canonical_key, CONCAT(target_id, ':', library_item_id))) AS books
+                FROM listening_item_daily
+                WHERE target_id IN ({placeholders})
+                  AND day >= UTC_DATE() - INTERVAL 29 DAY
+                  AND book_completions > 0
+                """,
+                params,
+            )
+            stats["books_30d"] = int((cur.fetchone() or {}).get("books") or 0)
+
+            cur.execute(
+                f"""
+                SELECT day - INTERVAL WEEKDAY(day) DAY AS week_start, SUM(listened_sec) AS sec
+                FROM listening_user_daily
+                WHERE target_id IN ({placeholders})
+                  AND day >= UTC_DATE() - INTERVAL WEEKDAY(UTC_DATE()) DAY - INTERVAL 11 WEEK
+                GROUP BY week_start
+                ORDER BY week_start DESC
+                """,
+                params,
+            )
+            stats["weekly"] = [
+                {"week_start": str(row["week_start"]), "hours": round(float(row.get("sec") or 0) / 3600, 1)}
+                for row in cur.fetchall()
+            ]
+
+            cur.execute(
+                f"""
+                SELECT DATE_FORMAT(day, '%%Y-%%m') AS month,
+                       COUNT(DISTINCT COALESCE(canonical_key, CONCAT(target_id, ':', library_item_id))) AS books
+                FROM listening_item_daily
+                WHERE target_id IN ({placeholders})
+                  AND day >= DATE_FORMAT(UTC_DATE() - INTERVAL 11 MONTH, '%%Y-%%m-01')
+                  AND book_completions > 0
+                GROUP BY month
+                ORDER BY month DESC
+                """,
+                params,
+            )
+            stats["monthly"] = [{"month": row["month"], "books": int(row.get("books") or 0)} for row in cur.fetchall()]
+
+            cur.execute(
+                f"""
+                SELECT target_id,
+                       SUM(listened_sec) AS sec,
+                       SUM(books_finished) AS books,
+                       SUM(episodes_finished) AS episodes,
+                       SUM(updates) AS updates,
+                       MAX(day) AS last_active
+                FROM listening_user_daily
+                WHERE target_id IN ({placeholders})
+                  AND day >= UTC_DATE() - INTERVAL 29 DAY
+                GROUP BY target_id
+                ORDER BY target_id
+                """,
+                params,
+            )
+            stats["targets"] = [
+                {
+                    "target_id": row["target_id"],
+                    "hours": round(float(row.get("sec") or 0) / 3600, 1),
+                    "books_finished": int(row.get("books") or 0),
+                    "episodes_finished": int(row.get("episodes") or 0),
+                    "updates": int(row.get("updates") or 0),
+                    "last_active": str(row["last_active"]) if row.get("last_active") else None,
+                }
+                for row in cur.fetchall()
+            ]
+    return stats
+
+
+@app.route("/stats")
+@login_required
+def stats_view():
+    user = current_user()
+    stats = get_listening_stats(sorted(get_user_target_urls(int(user["id"])).keys()))
+    return render_template("stats.html", user=user, stats=stats)
+
+
+@app.route("/api/stats")
+@login_required
+def stats_api():
+    user = current_user()
+    return jsonify(get_listening_stats(sorted(get_user_target_urls(int(user["id"])).keys())))
+
+
+@app.route("/api/metrics")
+@login_required
+def metrics_api():
+    with METADATA_CACHE_LOCK:
+        metadata_cache = {**METADATA_CACHE_STATS, "entries": len(METADATA_CACHE)}
+    with HTTP_METRICS_LOCK:
+        http_hosts = {
+            host: {
+                "requests": int(stats["requests"]),
+                "errors": int(stats["errors"]),
+                "avg_ms": round(stats["total_ms"] / stats["requests"], 1) if stats["requests"] else 0.0,
+                "max_ms": round(stats["max_ms"], 1),
+            }
+            for host, stats in sorted(HTTP_METRICS.items())
+        }
+    return jsonify({"metadata_cache": metadata_cache, "http": http_hosts})
+
+
 @app.route("/cover/<target_id>/<library_item_id>")
 @login_required
 def cover_proxy(target_id: str, library_item_id: str):
@@ -2994,7 +4169,7 @@ def cover_proxy(target_id: str, library_item_id: str):
         return ("", 404)
 
     try:
-        resp = requests.get(
+        resp = http_get(
             f"{target['url']}/api/items/{library_item_id}/cover",
             headers={"Authorization": f"Bearer {target['token']}"},
             timeout=10,
@@ -3128,19 +4303,9 @@ def mark_heard():
         flash("Title is required.", "error")
         return redirect(url_for("dashboard"))
 
-    enriched = enrich_with_audible(title, author, asin, isbn, series_name, series_index_raw)
-    asin = enriched["asin"]
-    isbn = enriched["isbn"]
-    series_name = enriched["series_name"]
-    series_index_raw = enriched["series_index"]
-    source = source if source != "manual" else enriched["source"]
-
-    series_index = None
-    if series_index_raw:
-        try:
-            series_index = float(series_index_raw)
-        except ValueError:
-            series_index = None
+    # Without an ASIN the Audible lookup runs in the background.
+    source = source if asin else "pending"
+    series_index = parse_series_index(series_index_raw)
 
     with get_conn() as conn:
         with conn.cursor() as cur:
@@ -3159,6 +4324,8 @@ def mark_heard():
                 """,
                 (user_id, title, author, asin, isbn, series_name, series_index, source),
             )
+    if source == "pending":
+        queue_book_enrichment()
     flash("Marked as heard.", "ok")
     return redirect(url_for("dashboard"))
 
@@ -3267,15 +4434,16 @@ def mark_synced_heard():
                 INSERT INTO progress_outbox
                 (target_id, server_id, principal_id, user_id, library_item_id, episode_id, canonical_key, progress, current_time_sec, duration, is_finished, last_update_ms, status)
                 VALUES (%s,%s,%s,%s,%s,'',NULLIF(%s,''),1,%s,%s,1,%s,'pending')
-                """,
+                """
+                + OUTBOX_COALESCE_SQL,
                 (target_id, server_id, principal_id, user_id, library_item_id, canonical_key, current_time, duration, now_ms),
             )
 
             cur.execute(
                 """
                 INSERT INTO progress_latest
-                (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
-                VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),1,%s,%s,1,NULL,%s,%s,'local_push')
+                (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source, change_seq)
+                VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),1,%s,%s,1,NULL,%s,%s,'local_push',NEXTVAL(progress_change_seq))
                 ON DUPLICATE KEY UPDATE
                   server_id = VALUES(server_id),
                   principal_id = VALUES(principal_id),
@@ -3287,7 +4455,8 @@ def mark_synced_heard():
                   is_finished = VALUES(is_finished),
                   finished_at_ms = VALUES(finished_at_ms),
                   last_update_ms = VALUES(last_update_ms),
-                  source = VALUES(source)
+                  source = VALUES(source),
+                  change_seq = VALUES(change_seq)
                 """,
                 (
                     target_id,
@@ -3306,7 +4475,7 @@ def mark_synced_heard():
 
             cur.execute(
                 """
-                INSERT INTO progress_history
+                INSERT IGNORE INTO progress_history
                 (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
                 VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),1,%s,%s,1,NULL,%s,%s,'local_push')
                 """,
@@ -3425,15 +4594,16 @@ def mark_synced_unheard():
                 INSERT INTO progress_outbox
                 (target_id, server_id, principal_id, user_id, library_item_id, episode_id, canonical_key, progress, current_time_sec, duration, is_finished, last_update_ms, status)
                 VALUES (%s,%s,%s,%s,%s,'',NULLIF(%s,''),0,0,%s,0,%s,'pending')
-                """,
+                """
+                + OUTBOX_COALESCE_SQL,
                 (target_id, server_id, principal_id, user_id, library_item_id, canonical_key, duration, now_ms),
             )
 
             cur.execute(
                 """
                 INSERT INTO progress_latest
-                (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
-                VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),0,0,%s,0,NULL,NULL,%s,'local_push')
+                (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source, change_seq)
+                VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),0,0,%s,0,NULL,NULL,%s,'local_push',NEXTVAL(progress_change_seq))
                 ON DUPLICATE KEY UPDATE
                   server_id = VALUES(server_id),
                   principal_id = VALUES(principal_id),
@@ -3445,7 +4615,8 @@ def mark_synced_unheard():
                   is_finished = VALUES(is_finished),
                   finished_at_ms = VALUES(finished_at_ms),
                   last_update_ms = VALUES(last_update_ms),
-                  source = VALUES(source)
+                  source = VALUES(source),
+                  change_seq = VALUES(change_seq)
                 """,
                 (
                     target_id,
@@ -3462,7 +4633,7 @@ def mark_synced_unheard():
 
             cur.execute(
                 """
-                INSERT INTO progress_history
+                INSERT IGNORE INTO progress_history
                 (target_id, server_id, principal_id, user_id, library_item_id, episode_id, media_progress_id, canonical_key, progress, current_time_sec, duration, is_finished, started_at_ms, finished_at_ms, last_update_ms, source)
                 VALUES (%s,%s,%s,%s,%s,'',%s,NULLIF(%s,''),0,0,%s,0,NULL,NULL,%s,'local_push')
                 """,
@@ -3501,18 +4672,9 @@ def add_manual_book():
         flash("Title is required.", "error")
         return redirect(url_for("dashboard"))
 
-    enriched = enrich_with_audible(title, author, asin, isbn, series_name, series_index_raw)
-    asin = enriched["asin"]
-    isbn = enriched["isbn"]
-    series_name = enriched["series_name"]
-    series_index_raw = enriched["series_index"]
-
-    series_index = None
-    if series_index_raw:
-        try:
-            series_index = float(series_index_raw)
-        except ValueError:
-            series_index = None
+    # Without an ASIN the Audible lookup runs in the background.
+    source = "manual" if asin else "pending"
+    series_index = parse_series_index(series_index_raw)
 
     with get_conn() as conn:
         with conn.cursor() as cur:
@@ -3527,34 +4689,171 @@ def add_manual_book():
                   series_index = VALUES(series_index),
                   metadata_source = VALUES(metadata_source)
                 """,
-                (user_id, title, author, asin, isbn, series_name, series_index, enriched["source"]),
+                (user_id, title, author, asin, isbn, series_name, series_index, source),
             )
+    if source == "pending":
+        queue_book_enrichment()
     flash("Book added.", "ok")
     return redirect(url_for("dashboard"))
 
 
+HISTORY_PAGE_SIZE = 50
+
+
+def _encode_history_cursor(values: list[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_history_cursor(raw: str) -> list[Any] | None:
+    if not raw:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return values if isinstance(values, list) else None
+
+
+def _history_page_keys(
+    cur: Any,
+    view: str,
+    target_ids: list[str],
+    finished_values: list[int],
+    sources: list[str],
+    cursor: list[Any] | None,
+    limit: int,
+) -> list[tuple[Any, ...]]:
+    # One index-only range scan on idx_*_page per (target, finished, source)
+    # combination, merged here. Sort keys are (last_update_ms, target_id,
+    # user_id, library_item_id) for progress_latest and (last_update_ms, id)
+    # for progress_history, both descending.
+    keys: list[tuple[Any, ...]] = []
+    for target_id in target_ids:
+        for finished in finished_values:
+            for source in sources:
+                params: list[Any] = [target_id, finished, source]
+                if view == "all":
+                    sql = """
+                        SELECT last_update_ms, id
+                        FROM progress_history FORCE INDEX (idx_history_page)
+                        WHERE target_id = %s AND episode_id = '' AND is_finished = %s AND source = %s
+                    """
+                    if cursor:
+                        sql += " AND (last_update_ms < %s OR (last_update_ms = %s AND id < %s))"
+                        params += [cursor[0], cursor[0], cursor[1]]
+                    sql += " ORDER BY last_update_ms DESC, id DESC LIMIT %s"
+                else:
+                    sql = """
+                        SELECT last_update_ms, user_id, library_item_id
+                        FROM progress_latest FORCE INDEX (idx_latest_page)
+                        WHERE target_id = %s AND episode_id = '' AND is_finished = %s AND source = %s
+                    """
+                    if cursor:
+                        if target_id < cursor[1]:
+                            sql += " AND last_update_ms <= %s"
+                            params.append(cursor[0])
+                        elif target_id > cursor[1]:
+                            sql += " AND last_update_ms < %s"
+                            params.append(cursor[0])
+                        else:
+                            sql += """
+                                AND (last_update_ms < %s OR (last_update_ms = %s AND (
+                                  user_id < %s OR (user_id = %s AND library_item_id < %s)
+                                )))
+                            """
+                            params += [cursor[0], cursor[0], cursor[2], cursor[2], cursor[3]]
+                    sql += " ORDER BY last_update_ms DESC, user_id DESC, library_item_id DESC LIMIT %s"
+                params.append(limit)
+                cur.execute(sql, tuple(params))
+                for row in cur.fetchall():
+                    if view == "all":
+                        keys.append((int(row["last_update_ms"]), int(row["id"])))
+                    else:
+                        keys.append((int(row["last_update_ms"]), target_id, row["user_id"], row["library_item_id"]))
+    keys.sort(reverse=True)
+    return keys[:limit]
+
+
 @app.route("/history")
 @login_required
 def history_view():
-    with get_conn() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                  pl.target_id, pl.principal_id, pl.user_id, pl.library_item_id, pl.canonical_key,
-                  pl.progress, pl.is_finished, pl.last_update_ms, pl.source,
-                  ii.title, ii.author, ii.asin
-                FROM progress_latest pl
-                LEFT JOIN item_identity ii
-                  ON ii.target_id = pl.target_id
-                 AND ii.library_item_id = pl.library_item_id
-                WHERE pl.episode_id = ''
-                ORDER BY last_update_ms DESC
-                LIMIT 300
-                """
-            )
-            rows = cur.fetchall()
-    return render_template("history.html", rows=rows, user=current_user())
+    user = current_user()
+    user_targets = sorted(get_user_target_urls(int(user["id"])).keys())
+    view = "all" if request.args.get("view") == "all" else "latest"
+    target_filter = (request.args.get("target") or "").strip()
+    source_filter = (request.args.get("source") or "").strip()
+    state_filter = (request.args.get("state") or "").strip()
+
+    target_ids = [target_filter] if target_filter in user_targets else user_targets
+    sources = [source_filter] if source_filter in ("remote_pull", "local_push") else ["remote_pull", "local_push"]
+    finished_values = {"finished": [1], "unfinished": [0]}.get(state_filter, [0, 1])
+    cursor = _decode_history_cursor(request.args.get("after") or "")
+    cursor_types = (int, int) if view == "all" else (int, str, str, str)
+    if cursor and (len(cursor) != len(cursor_types) or not all(isinstance(v, t) for v, t in zip(cursor, cursor_types))):
+        cursor = None
+
+    rows: list[dict[str, Any]] = []
+    next_cursor = ""
+    if target_ids:
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                keys = _history_page_keys(cur, view, target_ids, finished_values, sources, cursor, HISTORY_PAGE_SIZE + 1)
+                if len(keys) > HISTORY_PAGE_SIZE:
+                    keys = keys[:HISTORY_PAGE_SIZE]
+                    next_cursor = _encode_history_cursor(list(keys[-1]))
+                if keys:
+                    if view == "all":
+                        match = " OR ".join(["(h.id = %s AND h.last_update_ms = %s)"] * len(keys))
+                        params: list[Any] = [v for k in keys for v in (k[1], k[0])]
+                        cur.execute(
+                            f"""
+                            SELECT
+                              h.id, h.target_id, h.library_item_id, h.progress, h.is_finished,
+                              h.last_update_ms, h.source, ii.title, ii.author, ii.asin
+                            FROM progress_history h
+                            LEFT JOIN item_identity ii
+                              ON ii.target_id = h.target_id
+                             AND ii.library_item_id = h.library_item_id
+                            WHERE {match}
+                            """,
+                            tuple(params),
+                        )
+                        by_key = {(int(r["last_update_ms"]), int(r["id"])): r for r in cur.fetchall()}
+                    else:
+                        match = " OR ".join(
+                            ["(pl.target_id = %s AND pl.user_id = %s AND pl.library_item_id = %s AND pl.episode_id = '')"] * len(keys)
+                        )
+                        params = [v for k in keys for v in (k[1], k[2], k[3])]
+                        cur.execute(
+                            f"""
+                            SELECT
+                              pl.target_id, pl.user_id, pl.library_item_id, pl.progress, pl.is_finished,
+                              pl.last_update_ms, pl.source, ii.title, ii.author, ii.asin
+                            FROM progress_latest pl
+                            LEFT JOIN item_identity ii
+                              ON ii.target_id = pl.target_id
+                             AND ii.library_item_id = pl.library_item_id
+                            WHERE {match}
+                            """,
+                            tuple(params),
+                        )
+                        by_key = {
+                            (int(r["last_update_ms"]), r["target_id"], r["user_id"], r["library_item_id"]): r
+                            for r in cur.fetchall()
+                        }
+                    rows = [by_key[k] for k in keys if k in by_key]
+
+    for r in rows:
+        r["updated"] = datetime.fromtimestamp(int(r.get("last_update_ms") or 0) / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+    filters = {"view": view, "target": target_filter, "source": source_filter, "state": state_filter}
+    return render_template(
+        "history.html",
+        rows=rows,
+        user=user,
+        user_targets=user_targets,
+        filters=filters,
+        next_cursor=next_cursor,
+    )
 
 
 if __name__ == "__main__":